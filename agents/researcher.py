@@ -3,12 +3,14 @@ Job Research Agent
 This agent specializes in analyzing job descriptions and researching companies.
 """
 
+import functools
 from crewai import Agent
-from config.ollama_config import create_agent_with_ollama
-from tools.job_analyzer import JobDescriptionAnalyzer
+from config.ollama_config import create_agent_with_ollama, RESEARCH_MODEL, VERBOSE
+from tools.job_analyzer import JOB_ANALYZER
 
+@functools.lru_cache(maxsize=1)
 def create_researcher_agent():
-    """Create the job research specialist agent"""
+    """Create the job research specialist agent (built once and reused)"""
     
     role = "Job Research Specialist"
     goal = "Analyze job descriptions and research companies to understand requirements and culture"
@@ -17,7 +19,7 @@ def create_researcher_agent():
     You have years of experience in HR and recruitment, and you know what makes a job posting 
     attractive to candidates and what companies are looking for in their ideal hires."""
     
-    tools = [JobDescriptionAnalyzer()]
+    tools = [JOB_ANALYZER]
     
     try:
         agent = create_agent_with_ollama(
@@ -25,7 +27,8 @@ def create_researcher_agent():
             goal=goal,
             backstory=backstory,
             tools=tools,
-            verbose=True
+            verbose=VERBOSE,
+            model_name=RESEARCH_MODEL
         )
         return agent
     except Exception as e:
@@ -36,7 +39,7 @@ def create_researcher_agent():
             goal=goal,
             backstory=backstory,
             tools=tools,
-            verbose=True,
+            verbose=VERBOSE,
             allow_delegation=False
         )
 
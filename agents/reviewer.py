@@ -3,11 +3,13 @@ Email Reviewer Agent
 This agent specializes in reviewing and improving job application emails.
 """
 
+import functools
 from crewai import Agent
-from config.ollama_config import create_agent_with_ollama
+from config.ollama_config import create_agent_with_ollama, WRITING_MODEL, VERBOSE
 
+@functools.lru_cache(maxsize=1)
 def create_reviewer_agent():
-    """Create the email quality reviewer agent"""
+    """Create the email quality reviewer agent (built once and reused)"""
     
     role = "Email Quality Reviewer"
     goal = "Review and improve email drafts to ensure they are professional and compelling"
@@ -23,7 +25,8 @@ def create_reviewer_agent():
             goal=goal,
             backstory=backstory,
             tools=[],
-            verbose=True
+            verbose=VERBOSE,
+            model_name=WRITING_MODEL
         )
         return agent
     except Exception as e:
@@ -34,7 +37,7 @@ def create_reviewer_agent():
             goal=goal,
             backstory=backstory,
             tools=[],
-            verbose=True,
+            verbose=VERBOSE,
             allow_delegation=False
         )
 
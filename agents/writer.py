@@ -3,12 +3,14 @@ Email Writer Agent
 This agent specializes in writing compelling, personalized job application emails.
 """
 
+import functools
 from crewai import Agent
-from config.ollama_config import create_agent_with_ollama
-from tools.email_templates import EmailTemplateManager
+from config.ollama_config import create_agent_with_ollama, WRITING_MODEL, VERBOSE
+from tools.email_templates import EMAIL_TEMPLATES
 
+@functools.lru_cache(maxsize=1)
 def create_writer_agent():
-    """Create the professional email writer agent"""
+    """Create the professional email writer agent (built once and reused)"""
     
     role = "Professional Email Writer"
     goal = "Write compelling, personalized job application emails based on research"
@@ -18,7 +20,7 @@ def create_writer_agent():
     personal, professional, and compelling. You understand the psychology of what hiring 
     managers want to see and how to make candidates memorable."""
     
-    tools = [EmailTemplateManager()]
+    tools = [EMAIL_TEMPLATES]
     
     try:
         agent = create_agent_with_ollama(
@@ -26,7 +28,8 @@ def create_writer_agent():
             goal=goal,
             backstory=backstory,
             tools=tools,
-            verbose=True
+            verbose=VERBOSE,
+            model_name=WRITING_MODEL
         )
         return agent
     except Exception as e:
@@ -37,7 +40,7 @@ def create_writer_agent():
             goal=goal,
             backstory=backstory,
             tools=tools,
-            verbose=True,
+            verbose=VERBOSE,
             allow_delegation=False
         )
 
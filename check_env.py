@@ -5,79 +5,62 @@ Check for conflicting environment variables that might cause OpenAI API key erro
 
 import os
 
+def _find_vars(names):
+    """Return the non-empty environment variables among names, in the given order"""
+    present = os.environ.keys() & set(names)
+    return {var: os.environ[var] for var in names if var in present and os.environ[var]}
+
+def _report(found, found_label, missing_label, mask_keys=("API_KEY",)):
+    """Print the variables found for one group, masking secret values"""
+    if not found:
+        print(missing_label)
+        return
+    
+    print(found_label)
+    for var, value in found.items():
+        # Mask the API key for security
+        if any(key in var for key in mask_keys):
+            value = value[:8] + "..." + value[-4:] if len(value) > 12 else "***"
+        print(f"   {var}: {value}")
+
 def check_environment():
     """Check for potentially conflicting environment variables"""
     print("🔍 Checking environment variables...")
     print("=" * 50)
     
     # Check for OpenAI-related environment variables
-    openai_vars = [
+    found_openai_vars = _find_vars([
         "OPENAI_API_KEY",
         "OPENAI_API_BASE",
         "OPENAI_ORGANIZATION",
         "LITELLM_API_KEY",
         "LITELLM_MODEL",
         "LITELLM_BASE_URL"
-    ]
-    
-    found_openai_vars = []
-    for var in openai_vars:
-        value = os.getenv(var)
-        if value:
-            found_openai_vars.append((var, value))
-    
+    ])
+    _report(found_openai_vars,
+            "⚠️  Found OpenAI-related environment variables:",
+            "✅ No OpenAI-related environment variables found")
     if found_openai_vars:
-        print("⚠️  Found OpenAI-related environment variables:")
-        for var, value in found_openai_vars:
-            # Mask the API key for security
-            if "API_KEY" in var:
-                masked_value = value[:8] + "..." + value[-4:] if len(value) > 12 else "***"
-                print(f"   {var}: {masked_value}")
-            else:
-                print(f"   {var}: {value}")
         print("\n💡 These might be causing conflicts with Ollama.")
         print("   Consider unsetting them: unset OPENAI_API_KEY")
-    else:
-        print("✅ No OpenAI-related environment variables found")
     
     # Check for CrewAI-specific environment variables
-    crewai_vars = [
+    _report(_find_vars([
         "CREWAI_LLM",
         "CREWAI_MODEL",
         "CREWAI_BASE_URL"
-    ]
-    
-    found_crewai_vars = []
-    for var in crewai_vars:
-        value = os.getenv(var)
-        if value:
-            found_crewai_vars.append((var, value))
-    
-    if found_crewai_vars:
-        print("\n⚠️  Found CrewAI-related environment variables:")
-        for var, value in found_crewai_vars:
-            print(f"   {var}: {value}")
-    else:
-        print("\n✅ No CrewAI-specific environment variables found")
+    ]),
+            "\n⚠️  Found CrewAI-related environment variables:",
+            "\n✅ No CrewAI-specific environment variables found")
     
     # Check for Ollama environment variables
-    ollama_vars = [
+    _report(_find_vars([
         "OLLAMA_HOST",
-        "OLLAMA_ORIGINS"
-    ]
-    
-    found_ollama_vars = []
-    for var in ollama_vars:
-        value = os.getenv(var)
-        if value:
-            found_ollama_vars.append((var, value))
-    
-    if found_ollama_vars:
-        print("\n✅ Found Ollama environment variables:")
-        for var, value in found_ollama_vars:
-            print(f"   {var}: {value}")
-    else:
-        print("\n✅ No Ollama environment variables found (using defaults)")
+        "OLLAMA_ORIGINS",
+        "OLLAMA_KEEP_ALIVE"
+    ]),
+            "\n✅ Found Ollama environment variables:",
+            "\n✅ No Ollama environment variables found (using defaults)")
     
     print("\n" + "=" * 50)
     
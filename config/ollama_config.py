@@ -4,23 +4,59 @@ Configures the local Ollama models for use with the job application email agent.
 """
 
 import os
-from crewai import Agent
-from langchain_ollama import OllamaLLM
+import httpx
+import ollama
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+
+# How long Ollama keeps a model resident after its last request
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# Verbose CrewAI console output (Rich-rendered step logs); off unless JD_AGENT_VERBOSE=1
+VERBOSE = os.getenv("JD_AGENT_VERBOSE", "0") == "1"
+
+# Number of requests the Ollama server handles concurrently (mirrors the server setting)
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "3"))
+
+# Per-agent quantizations: fact extraction benefits from Q8_0 accuracy, while the
+# style-heavy writer and reviewer tolerate the faster Q4_K_M
+RESEARCH_MODEL = "ollama/gemma3:1b-it-q8_0"
+WRITING_MODEL = "ollama/gemma3:1b-it-q4_K_M"
+
+# Shared native client: its httpx connection pool keeps sockets to Ollama alive
+# across agents, JDs and warmup calls instead of reconnecting per request
+ollama_client = ollama.Client(
+    host=OLLAMA_BASE_URL,
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=8)
+)
+
+# Models already preloaded in this process
+_warmed_models = set()
 
 def get_ollama_llm(model_name: str = "ollama/mistral:latest"):
     """
     Get an Ollama LLM instance for use with CrewAI agents.
     
+    The research and drafting tasks run concurrently, so the Ollama server should
+    accept parallel requests for the same model, e.g.:
+        OLLAMA_NUM_PARALLEL=3 OLLAMA_MAX_LOADED_MODELS=2 ollama serve
+    
+    OLLAMA_MAX_LOADED_MODELS=2 keeps both the research and writing quantizations resident.
+    
     Args:
         model_name (str): Name of the Ollama model to use (should include 'ollama/' prefix)
         
     Returns:
-        Ollama: Configured LangChain Ollama LLM instance
+        NativeOllamaLLM: Configured native Ollama LLM adapter
     """
+    from config.ollama_llm import NativeOllamaLLM  # Defers CrewAI until an LLM is needed
+    
     try:
-        llm = OllamaLLM(
+        llm = NativeOllamaLLM(
             model=model_name,
-            base_url="http://localhost:11434"  # Default Ollama URL
+            base_url=OLLAMA_BASE_URL,  # Default Ollama URL
+            keep_alive=OLLAMA_KEEP_ALIVE  # Keep the model loaded between agent turns
         )
         return llm
     except Exception as e:
@@ -28,7 +64,28 @@ def get_ollama_llm(model_name: str = "ollama/mistral:latest"):
         print("Please ensure Ollama is running and the model is available")
         return None
 
-def create_agent_with_ollama(role: str, goal: str, backstory: str, tools=None, verbose: bool = True):
+def warmup_ollama_model(model_name: str = "ollama/mistral:latest"):
+    """
+    Preload a model into memory so the first agent call doesn't pay the cold load.
+    
+    Ollama loads a model when it receives a generate request with an empty prompt;
+    the model then stays resident for OLLAMA_KEEP_ALIVE. Only runs once per model.
+    
+    Args:
+        model_name (str): Name of the Ollama model to preload ('ollama/' prefix optional)
+    """
+    model = model_name.split("ollama/", 1)[-1]
+    if model in _warmed_models:
+        return
+    
+    try:
+        ollama_client.generate(model=model, prompt="", keep_alive=OLLAMA_KEEP_ALIVE)
+        _warmed_models.add(model)
+    except Exception as e:
+        print(f"⚠️  Could not preload model {model}: {e}")
+
+def create_agent_with_ollama(role: str, goal: str, backstory: str, tools=None, verbose: bool = VERBOSE,
+                             model_name: str = "ollama/mistral:latest"):
     """
     Create a CrewAI agent with Ollama LLM integration.
     
@@ -38,14 +95,19 @@ def create_agent_with_ollama(role: str, goal: str, backstory: str, tools=None, v
         backstory (str): Agent's backstory
         tools: List of tools for the agent
         verbose (bool): Whether to enable verbose output
+        model_name (str): Ollama model for the agent (should include 'ollama/' prefix)
         
     Returns:
         Agent: Configured CrewAI agent
     """
-    llm = get_ollama_llm()
+    from crewai import Agent  # Deferred so importing this config doesn't load CrewAI
+    
+    llm = get_ollama_llm(model_name)
     if llm is None:
         raise RuntimeError("Failed to initialize Ollama LLM")
     
+    warmup_ollama_model(llm.model)
+    
     return Agent(
         role=role,
         goal=goal,
@@ -59,9 +121,11 @@ def create_agent_with_ollama(role: str, goal: str, backstory: str, tools=None, v
 # Available models for reference
 AVAILABLE_MODELS = [
     "ollama/gemma3:1b",      # 1.5B parameter model - good for basic tasks
+    "ollama/gemma3:1b-it-q8_0",    # Q8_0 quantization - used for research (accuracy)
+    "ollama/gemma3:1b-it-q4_K_M",  # Q4_K_M quantization - used for writing/review (speed)
     "ollama/all-minilm:latest",     # 45MB model - very fast but limited capability
     "ollama/nomic-embed-text:latest", # 274MB embedding model
-    "ollama/mxbai-embed-large:latest" # 669MB embedding model
+    "ollama/mxbai-embed-large:latest", # 669MB embedding model
     "ollama/mistral:latest"
 ]
 
@@ -0,0 +1,122 @@
+"""
+Native Ollama LLMs for CrewAI
+CrewAI LLM adapters that call Ollama through the shared native client, with an
+optional exact-match response cache. Kept apart from config.ollama_config so the
+model settings can be imported without pulling in CrewAI.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Union
+import diskcache
+import ollama
+from crewai import BaseLLM
+from config.ollama_config import OLLAMA_BASE_URL, OLLAMA_KEEP_ALIVE, OLLAMA_NUM_PARALLEL, ollama_client
+
+# Bounds the LLM calls in flight across all agents and crews to what the server
+# runs concurrently; further calls wait here instead of queueing inside Ollama
+_ollama_slots = threading.BoundedSemaphore(OLLAMA_NUM_PARALLEL)
+
+# Exact-match LLM response cache, shared across runs
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+# Set LLM_CACHE=0 to always query Ollama, bypassing the response cache
+LLM_CACHE = os.getenv("LLM_CACHE", "1") == "1"
+
+class NativeOllamaLLM(BaseLLM):
+    """
+    CrewAI LLM that talks to Ollama through the shared native ollama.Client.
+    
+    Being a BaseLLM, CrewAI calls `call()` directly instead of rebuilding a LiteLLM
+    model from `model` and `base_url`, so keep_alive and the Ollama options (num_ctx,
+    num_thread, ...) actually reach the server. Skips the LangChain and LiteLLM
+    wrapper layers on each call.
+    """
+    
+    def __init__(self, model: str, base_url: str = OLLAMA_BASE_URL,
+                 keep_alive: str = OLLAMA_KEEP_ALIVE, num_ctx: int = 2048,
+                 temperature: Optional[float] = None, **options):
+        super().__init__(model=model, temperature=temperature)
+        self.base_url = base_url
+        self.keep_alive = keep_alive
+        self.options = {"num_ctx": num_ctx, **options}
+        self._client = ollama_client if base_url == OLLAMA_BASE_URL else ollama.Client(host=base_url)
+    
+    def _request_options(self, **overrides) -> Dict[str, Any]:
+        """Ollama options for one request, including the stop words CrewAI sets on the LLM"""
+        options = dict(self.options)
+        if self.temperature is not None:
+            options["temperature"] = self.temperature
+        if self.stop:
+            options["stop"] = list(self.stop)
+        options.update(overrides)
+        return options
+    
+    def _chat(self, messages: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+        """Send the conversation to Ollama's chat endpoint and return the reply text"""
+        with _ollama_slots:
+            response = self._client.chat(
+                model=self.model.split("ollama/", 1)[-1],  # The native API takes bare model names
+                messages=messages,
+                keep_alive=self.keep_alive,
+                options=options
+            )
+        return response["message"]["content"]
+    
+    def call(self, messages: Union[str, List[Dict[str, str]]], tools=None, callbacks=None,
+             available_functions=None, from_task=None, from_agent=None) -> str:
+        """Complete a CrewAI prompt or message list"""
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        return self._chat(messages, self._request_options())
+    
+    def invoke(self, prompt: str, **options) -> str:
+        """Complete a single prompt, optionally overriding Ollama options"""
+        return self._chat([{"role": "user", "content": prompt}], self._request_options(**options))
+    
+    __call__ = invoke
+    
+    def get_context_window_size(self) -> int:
+        return self.options["num_ctx"]
+
+# Opened on first use rather than at import
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def _get_response_cache() -> diskcache.Cache:
+    """Return the on-disk LLM response cache, opening it on first use"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = diskcache.Cache(LLM_CACHE_DIR)
+        return _response_cache
+
+class CachedOllamaLLM(NativeOllamaLLM):
+    """
+    Native Ollama LLM that reuses responses to exactly repeated requests.
+    
+    The key is a hash of the model, the Ollama options and the full message list, so
+    a response is only reused for the same prompt, job description included.
+    Responses are neither read nor stored while `use_cache` is off.
+    """
+    
+    def __init__(self, *args, use_cache: bool = LLM_CACHE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_cache = use_cache
+    
+    def _chat(self, messages: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+        if not self.use_cache:
+            return super()._chat(messages, options)
+        
+        request = json.dumps({"model": self.model, "options": options, "messages": messages},
+                             sort_keys=True, default=str)
+        key = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        
+        cache = _get_response_cache()
+        response = cache.get(key)
+        if response is None:
+            response = super()._chat(messages, options)
+            cache.set(key, response, expire=LLM_CACHE_TTL)
+        return response
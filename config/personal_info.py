@@ -3,6 +3,8 @@ Personal Information Configuration
 This file contains personal information that will be used to customize email templates.
 """
 
+from types import MappingProxyType
+
 # Personal Information - Customize these values
 PERSONAL_INFO = {
     "your_name": "Your Name",
@@ -75,39 +77,47 @@ TEMPLATE_PREFERENCES = {
     "customize_for_company": True
 }
 
+def _build_static_customization():
+    """Build the job-independent part of the customization data"""
+    return {
+        **PERSONAL_INFO,
+        "key_skills": ", ".join(PERSONAL_INFO["key_skills"][:3]),  # Top 3 skills as string
+    }
+
+# Personal portion of the customization data, rebuilt only when PERSONAL_INFO changes
+_STATIC_CUSTOMIZATION = _build_static_customization()
+
 def get_personal_info():
-    """Get the personal information dictionary"""
-    return PERSONAL_INFO.copy()
+    """Get a read-only view of the personal information dictionary"""
+    return MappingProxyType(PERSONAL_INFO)
 
 def get_email_preferences():
-    """Get the email preferences dictionary"""
-    return EMAIL_PREFERENCES.copy()
+    """Get a read-only view of the email preferences dictionary"""
+    return MappingProxyType(EMAIL_PREFERENCES)
 
 def get_template_preferences():
-    """Get the template preferences dictionary"""
-    return TEMPLATE_PREFERENCES.copy()
+    """Get a read-only view of the template preferences dictionary"""
+    return MappingProxyType(TEMPLATE_PREFERENCES)
 
 def update_personal_info(key, value):
     """Update a specific personal information field"""
+    global _STATIC_CUSTOMIZATION
     if key in PERSONAL_INFO:
         PERSONAL_INFO[key] = value
+        _STATIC_CUSTOMIZATION = _build_static_customization()
         return True
     return False
 
 def get_customization_data(job_analysis):
     """Get customization data combining personal info and job analysis"""
-    personal = get_personal_info()
-    
-    # Merge personal info with job analysis
-    customization_data = {
-        **personal,
+    # Merge the precomputed personal info with the job-specific fields
+    return {
+        **_STATIC_CUSTOMIZATION,
         **job_analysis,
-        "key_skills": ", ".join(personal["key_skills"][:3]),  # Top 3 skills as string
-        "relevant_experience": personal["relevant_experience"],
-        "industry_focus": job_analysis.get("industry", personal["industry_focus"])
+        "key_skills": _STATIC_CUSTOMIZATION["key_skills"],
+        "relevant_experience": _STATIC_CUSTOMIZATION["relevant_experience"],
+        "industry_focus": job_analysis.get("industry", _STATIC_CUSTOMIZATION["industry_focus"])
     }
-    
-    return customization_data
 
 if __name__ == "__main__":
     # Test the configuration
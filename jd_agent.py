@@ -5,34 +5,98 @@ This agent helps write personalized job application emails using local Ollama mo
 """
 
 import os
+import sys
+import asyncio
+import hashlib
+import logging
+import functools
+import diskcache
 from dotenv import load_dotenv
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import BaseTool
 from typing import List, Dict, Any
-from langchain_ollama import OllamaLLM
+from config.ollama_config import (
+    OLLAMA_BASE_URL, OLLAMA_KEEP_ALIVE, OLLAMA_NUM_PARALLEL,
+    RESEARCH_MODEL, WRITING_MODEL, VERBOSE, warmup_ollama_model
+)
+from config.ollama_llm import CachedOllamaLLM
 from tools.llm_cv_parser import LLMCVParser
 from tools.personalization_engine import PersonalizationEngine
 
 # Load environment variables
 load_dotenv()
 
-# Configure Ollama LLM
-ollama_llm = OllamaLLM(
-    model="ollama/gemma3:1b",
-    base_url="http://localhost:11434"
-)
+# Keep CrewAI's own logging quiet unless verbose output was requested
+if not VERBOSE:
+    logging.getLogger("crewai").setLevel(logging.WARNING)
 
 # Initialize LLM-based CV parser and personalization engine
 cv_parser = LLMCVParser()
-cv_data = cv_parser.parse_cv()
+cv_data = cv_parser.parse_cv_cached()
 
 if cv_data:
-    personalization_engine = PersonalizationEngine(cv_data)
+    personalization_engine = PersonalizationEngine(cv_data, embed_fn=cv_parser.embed_chunks)
     print(f"✅ CV loaded: {cv_parser.get_summary()}")
 else:
     personalization_engine = None
     print("⚠️  No CV data available - will use generic templates")
 
+# Prepare CV and candidate information once per process
+cv_summary = cv_parser.get_summary() if cv_data else "No CV data available"
+if personalization_engine:
+    candidate_info = personalization_engine.get_candidate_summary()
+else:
+    candidate_info = "Generic candidate information"
+
+# Static candidate context placed at the front of every agent's backstory. It is
+# byte-identical across kickoffs, so Ollama can reuse the prefilled KV cache for it
+# instead of re-tokenizing it inside every task prompt.
+CANDIDATE_CONTEXT = f"""CANDIDATE CV INFORMATION:
+{cv_summary}
+
+CANDIDATE INFORMATION:
+{candidate_info}
+
+"""
+
+# Sent as num_keep so the prefix survives when Ollama shifts a full context window.
+# There's no tokenizer here, so estimate generously (~3 characters per token, plus
+# the chat template and role line) and leave half of the 2048-token context free
+CANDIDATE_CONTEXT_TOKENS = min(len(CANDIDATE_CONTEXT) // 3 + 64, 1024)
+
+# Configure Ollama LLMs (responses are cached across runs); these two instances,
+# and their HTTP clients, are shared by every agent and crew. Every request sends
+# keep_alive, so the models stay resident between crew calls
+# The researcher uses a Q8_0 quantization for accuracy, writer and reviewer a faster Q4_K_M
+research_llm = CachedOllamaLLM(
+    model=RESEARCH_MODEL,
+    base_url=OLLAMA_BASE_URL,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    num_thread=os.cpu_count(),  # Forwarded to Ollama as a request option
+    num_keep=CANDIDATE_CONTEXT_TOKENS
+)
+ollama_llm = CachedOllamaLLM(
+    model=WRITING_MODEL,
+    base_url=OLLAMA_BASE_URL,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    num_thread=os.cpu_count(),  # Forwarded to Ollama as a request option
+    num_keep=CANDIDATE_CONTEXT_TOKENS
+)
+
+@functools.lru_cache(maxsize=256)
+def _analyze_jd(job_description: str) -> tuple:
+    """Analyze a job description; cached so repeated tool calls are free"""
+    # For now, return hardcoded analysis
+    # In future, this could use more sophisticated NLP
+    return (
+        ("role_title", "Software Engineer"),
+        ("company", "TechCorp Inc."),
+        ("key_requirements", ("Python", "React", "AWS", "3+ years experience")),
+        ("company_culture", "Fast-paced startup environment"),
+        ("industry", "Technology"),
+        ("seniority_level", "Mid-level")
+    )
+
 class JobDescriptionAnalyzer(BaseTool):
     """Tool for analyzing job descriptions and extracting key information"""
     
@@ -41,16 +105,12 @@ class JobDescriptionAnalyzer(BaseTool):
     
     def _run(self, job_description: str) -> Dict[str, Any]:
         """Analyze the job description and return structured information"""
-        # For now, return hardcoded analysis
-        # In future, this could use more sophisticated NLP
-        return {
-            "role_title": "Software Engineer",
-            "company": "TechCorp Inc.",
-            "key_requirements": ["Python", "React", "AWS", "3+ years experience"],
-            "company_culture": "Fast-paced startup environment",
-            "industry": "Technology",
-            "seniority_level": "Mid-level"
-        }
+        analysis = dict(_analyze_jd(job_description))
+        # Hand out a fresh list so callers can't mutate the cached entry
+        analysis["key_requirements"] = list(analysis["key_requirements"])
+        return analysis
+
+_JOB_ANALYZER = JobDescriptionAnalyzer()
 
 def create_agents():
     """Create the CrewAI agents for the job application email system"""
@@ -59,27 +119,27 @@ def create_agents():
     researcher = Agent(
         role='Job Research Specialist',
         goal='Analyze job descriptions and extract specific information to help a job candidate write a compelling application',
-        backstory="""You are an expert at analyzing job descriptions and helping job candidates understand what companies are looking for. 
+        backstory=CANDIDATE_CONTEXT + """You are an expert at analyzing job descriptions and helping job candidates understand what companies are looking for. 
         You work for job seekers, not companies. Your job is to extract real, specific information from job postings 
         so candidates can write personalized application emails. You never use placeholder text - you extract actual information.
         You also have access to the candidate's CV data to help match their background with job requirements.""",
-        verbose=True,
+        verbose=VERBOSE,
         allow_delegation=False,
-        tools=[JobDescriptionAnalyzer()],
-        llm=ollama_llm
+        tools=[_JOB_ANALYZER],
+        llm=research_llm
     )
     
     # Email Writer Agent
     writer = Agent(
         role='Professional Email Writer for Job Seekers',
         goal='Write compelling job application emails from the candidate\'s perspective, using CV data for personalization',
-        backstory="""You are a professional email writer who specializes in helping job candidates write application emails. 
+        backstory=CANDIDATE_CONTEXT + """You are a professional email writer who specializes in helping job candidates write application emails. 
         You ALWAYS write from the candidate's perspective - someone applying FOR a job, not someone offering a job. 
         You use real company names, real job titles, and real requirements from the research. 
         You never use placeholder text like [Company Name] or [Job Title].
         You write complete, professional emails with proper structure and compelling content.
         You have access to the candidate's CV data and use it to personalize the email with their actual experience, skills, and background.""",
-        verbose=True,
+        verbose=VERBOSE,
         allow_delegation=False,
         tools=[],  # No tools needed - generate email content directly
         llm=ollama_llm
@@ -89,66 +149,58 @@ def create_agents():
     reviewer = Agent(
         role='Email Quality Reviewer for Job Applications',
         goal='Ensure job application emails are written correctly from the candidate\'s perspective and contain no placeholder text',
-        backstory="""You are an expert at reviewing job application emails. Your most important job is to ensure the email 
+        backstory=CANDIDATE_CONTEXT + """You are an expert at reviewing job application emails. Your most important job is to ensure the email 
         is written from the CANDIDATE's perspective applying for a job, NOT from the company's perspective hiring someone. 
         You check that all placeholder text has been replaced with real information. If an email is fundamentally wrong, 
         you rewrite it completely. You ensure the tone is appropriate for someone applying for a position.
         You also verify that the email effectively uses the candidate's CV information for personalization.""",
-        verbose=True,
+        verbose=VERBOSE,
         allow_delegation=False,
         llm=ollama_llm
     )
     
     return researcher, writer, reviewer
 
-def create_tasks(researcher, writer, reviewer):
-    """Create the tasks for the agents to execute"""
-    
-    # Task 1: Research the job and company
-    research_task = Task(
-        description="""You are a job research specialist. Analyze the provided job description and extract key information.
+# Task description templates; CrewAI fills the {placeholders} from the kickoff inputs
+_JD_ANALYSIS_DESCRIPTION = """You are a job research specialist. Analyze the provided job description and extract key information.
         
         Job Description: {job_description}
         
-        CANDIDATE CV INFORMATION:
-        {cv_summary}
+        Most relevant parts of the candidate's CV:
+        {cv_highlights}
         
         Your task is to:
         1. Extract the job title, company name, and key requirements
-        2. Identify the company culture and industry
-        3. Determine what skills and experience are most important
-        4. Find key selling points that would make a candidate attractive
-        5. Analyze how well the candidate's CV matches the job requirements
-        6. Identify specific talking points based on the candidate's background
+        2. Determine what skills and experience are most important
+        3. Analyze how well the candidate's CV matches the job requirements
+        4. Identify specific talking points based on the candidate's background
         
         Be specific and extract actual information from the job description, not placeholder text.
-        Use the CV information to provide personalized insights.""",
-        agent=researcher,
-        expected_output="""A detailed analysis with specific information:
-        - Job Title: [actual job title from description]
-        - Company Name: [actual company name from description]
-        - Key Requirements: [list of actual requirements]
-        - Company Culture: [what you can infer about the company]
-        - Industry: [what industry this company operates in]
-        - Key Skills Needed: [most important technical and soft skills]
-        - CV Match Analysis: [how well candidate's background fits]
-        - Personalized Talking Points: [specific points based on candidate's CV]"""
-    )
-    
-    # Task 2: Write the initial email
-    writing_task = Task(
-        description="""You are a professional email writer creating a job application email. 
+        Use the CV information to provide personalized insights."""
+
+_COMPANY_RESEARCH_DESCRIPTION = """You are a job research specialist. Research the company behind the provided job description.
+        
+        Job Description: {job_description}
+        
+        Your task is to:
+        1. Identify the company culture and industry
+        2. Find key selling points that would make a candidate attractive to this company
+        
+        Be specific and extract actual information from the job description, not placeholder text."""
+
+_WRITING_DESCRIPTION = """You are a professional email writer creating a job application email. 
         
         IMPORTANT: You are writing as a JOB CANDIDATE applying for a position, NOT as a company hiring someone.
         
-        Use the research from the previous task to write a personalized job application email.
+        Write a first-pass personalized job application email directly from the job description.
+        
+        Job Description: {job_description}
         
-        CANDIDATE INFORMATION TO USE:
-        {candidate_info}
+        Use the candidate information from your background.
         
         The email must:
         1. Be written from the perspective of someone applying for the job
-        2. Include the actual company name and job title from the research
+        2. Include the actual company name and job title from the job description
         3. Express genuine interest in the specific role and company
         4. Highlight relevant skills and experience from the candidate's CV
         5. Use the candidate's actual name, background, and achievements
@@ -156,28 +208,13 @@ def create_tasks(researcher, writer, reviewer):
         7. NOT contain placeholder text like [Company Name] or [Job Title]
         8. Include specific examples from the candidate's experience that match the job requirements
         
-        Write a complete email with proper greeting, body, and closing. Use the actual information from the research task and the candidate's CV.""",
-        agent=writer,
-        context=[research_task],
-        expected_output="""A complete job application email that:
-        - Has a clear subject line
-        - Is written from the candidate's perspective
-        - Uses actual company and job information
-        - Shows genuine interest and enthusiasm
-        - Highlights relevant skills and experience from the candidate's CV
-        - Has a professional tone and structure
-        - Contains NO placeholder text
-        - Is personalized with the candidate's actual background"""
-    )
-    
-    # Task 3: Review and improve the email
-    review_task = Task(
-        description="""You are an email quality reviewer. Review the drafted job application email.
+        Write a complete email with proper greeting, body, and closing. Use the actual information from the job description and the candidate's CV."""
+
+_REVIEW_DESCRIPTION = """You are an email quality reviewer. Review the drafted job application email.
         
         CRITICAL CHECK: Ensure this email is written from the CANDIDATE's perspective applying for a job, NOT from the company's perspective.
         
-        CANDIDATE INFORMATION FOR VERIFICATION:
-        {candidate_info}
+        Verify against the candidate information from your background, and use the job research to correct and enrich the draft.
         
         Your task is to:
         1. Verify the email is written as a job application (not a job posting)
@@ -190,9 +227,56 @@ def create_tasks(researcher, writer, reviewer):
         
         If the email is fundamentally wrong (wrong perspective, major issues), rewrite it completely.
         If it's mostly correct, make improvements and corrections.
-        Make sure the personalization from the CV data is natural and compelling.""",
+        Make sure the personalization from the CV data is natural and compelling."""
+
+def create_tasks(researcher, writer, reviewer):
+    """Create the tasks for the agents to execute"""
+    
+    # Tasks 1a and 1b: Analyze the job and research the company, concurrently
+    jd_analysis_task = Task(
+        description=_JD_ANALYSIS_DESCRIPTION,
+        agent=researcher,
+        async_execution=True,  # Runs concurrently with the company research and the draft
+        expected_output="""A detailed analysis with specific information:
+        - Job Title: [actual job title from description]
+        - Company Name: [actual company name from description]
+        - Key Requirements: [list of actual requirements]
+        - Key Skills Needed: [most important technical and soft skills]
+        - CV Match Analysis: [how well candidate's background fits]
+        - Personalized Talking Points: [specific points based on candidate's CV]"""
+    )
+    
+    company_research_task = Task(
+        description=_COMPANY_RESEARCH_DESCRIPTION,
+        agent=researcher,
+        async_execution=True,  # Independent of the job analysis
+        expected_output="""A short company profile:
+        - Company Culture: [what you can infer about the company]
+        - Industry: [what industry this company operates in]
+        - Selling Points: [what would make a candidate attractive to this company]"""
+    )
+    
+    # Task 2: Write the first-pass email draft (independent of the research, runs in parallel)
+    writing_task = Task(
+        description=_WRITING_DESCRIPTION,
+        agent=writer,
+        async_execution=True,  # Runs concurrently with the research tasks
+        expected_output="""A complete job application email that:
+        - Has a clear subject line
+        - Is written from the candidate's perspective
+        - Uses actual company and job information
+        - Shows genuine interest and enthusiasm
+        - Highlights relevant skills and experience from the candidate's CV
+        - Has a professional tone and structure
+        - Contains NO placeholder text
+        - Is personalized with the candidate's actual background"""
+    )
+    
+    # Task 3: Review and improve the email
+    review_task = Task(
+        description=_REVIEW_DESCRIPTION,
         agent=reviewer,
-        context=[writing_task],
+        context=[jd_analysis_task, company_research_task, writing_task],  # Joins the parallel tasks
         expected_output="""A final, polished job application email that:
         - Is written from the candidate's perspective
         - Contains no placeholder text
@@ -203,15 +287,68 @@ def create_tasks(researcher, writer, reviewer):
         - Is tailored to the specific job and company"""
     )
     
-    return research_task, writing_task, review_task
+    return jd_analysis_task, company_research_task, writing_task, review_task
 
-def main():
+# Sample job description used when none are supplied
+DEFAULT_JOB_DESCRIPTION = """
+    Software Engineer - Full Stack
+    TechCorp Inc.
+    
+    We are looking for a talented Full Stack Software Engineer to join our growing team.
+    Requirements:
+    - 3+ years of experience in software development
+    - Proficiency in Python, JavaScript, and React
+    - Experience with cloud platforms (AWS preferred)
+    - Strong problem-solving skills
+    - Team player with excellent communication skills
+    
+    We offer a fast-paced startup environment with opportunities for growth and learning.
+    """
+
+# Whole-pipeline cache of final emails; bump the version when prompts or flow change
+EMAIL_CACHE_DIR = ".email_cache"
+EMAIL_CACHE_VERSION = "v1"
+EMAIL_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+
+def pipeline_cache_key(job_description: str) -> str:
+    """Key a final email by everything that determines it: JD, candidate context and models"""
+    key_source = "\0".join([job_description, CANDIDATE_CONTEXT, RESEARCH_MODEL, WRITING_MODEL, EMAIL_CACHE_VERSION])
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+def print_email(email):
+    """Print a final email"""
+    print("\n📧 Final Email:")
+    print("=" * 50)
+    print(email)
+    print("=" * 50)
+
+async def run_crews(crew, inputs: List[Dict[str, str]]) -> list:
+    """Run the crew once per input, OLLAMA_NUM_PARALLEL crews at a time
+    
+    The LLMs themselves cap the calls in flight at OLLAMA_NUM_PARALLEL, so crews can
+    overlap: one crew's single-call review runs while another fans out its drafts.
+    """
+    # A semaphore rather than fixed slices: the next job starts as soon as any
+    # crew finishes, so Ollama's batcher always has work in flight
+    slots = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+    
+    async def run_one(crew_inputs: Dict[str, str]):
+        async with slots:
+            # Each run gets its own copy so concurrent kickoffs don't share task state
+            return await crew.copy().kickoff_async(inputs=crew_inputs)
+    
+    # gather keeps results in input order
+    return list(await asyncio.gather(*(run_one(crew_inputs) for crew_inputs in inputs)))
+
+def main(job_descriptions: List[str] = None, use_cache: bool = True):
     """Main function to orchestrate the CrewAI workflow"""
     
+    job_descriptions = job_descriptions or [DEFAULT_JOB_DESCRIPTION]
+    
     print("🚀 Starting Job Application Email Agent...")
     
     # Validate Ollama configuration
-    if ollama_llm is None:
+    if research_llm is None or ollama_llm is None:
         print("❌ Failed to initialize Ollama LLM")
         print("Please check:")
         print("1. Ollama is running: ollama serve")
@@ -221,23 +358,31 @@ def main():
     
     print("✅ Ollama LLM configured successfully")
     
-    # Define the job description
-    job_description = """
-    Software Engineer - Full Stack
-    TechCorp Inc.
+    # --no-cache regenerates from scratch, so skip the LLM response cache too
+    if not use_cache:
+        research_llm.use_cache = ollama_llm.use_cache = False
     
-    We are looking for a talented Full Stack Software Engineer to join our growing team.
-    Requirements:
-    - 3+ years of experience in software development
-    - Proficiency in Python, JavaScript, and React
-    - Experience with cloud platforms (AWS preferred)
-    - Strong problem-solving skills
-    - Team player with excellent communication skills
+    # Serve previously generated emails without running the crew
+    email_cache = diskcache.Cache(EMAIL_CACHE_DIR) if use_cache else None
+    if email_cache is not None:
+        pending = []
+        for job_description in job_descriptions:
+            cached_email = email_cache.get(pipeline_cache_key(job_description))
+            if cached_email is None:
+                pending.append(job_description)
+            else:
+                print(f"♻️  Using cached email for: {job_description.strip()[:60]}...")
+                print_email(cached_email)
+        if not pending:
+            return
+        job_descriptions = pending
     
-    We offer a fast-paced startup environment with opportunities for growth and learning.
-    """
+    # Load the models now so the first agent turn doesn't pay the cold start
+    warmup_ollama_model(research_llm.model)
+    warmup_ollama_model(ollama_llm.model)
     
-    print(f"📋 Job Description: {job_description[:100]}...")
+    for job_description in job_descriptions:
+        print(f"📋 Job Description: {job_description[:100]}...")
     
     # Create agents
     try:
@@ -250,32 +395,24 @@ def main():
     
     # Create tasks with job description context
     try:
-        research_task, writing_task, review_task = create_tasks(researcher, writer, reviewer)
+        tasks = create_tasks(researcher, writer, reviewer)
         
-        # Prepare CV information for tasks
-        cv_summary = cv_parser.get_summary() if cv_data else "No CV data available"
-        
-        # Prepare candidate information for personalization
+        # Pick the CV chunks closest to each JD (all JDs scored in one batch)
+        cv_highlights = [[] for _ in job_descriptions]
         if personalization_engine:
-            candidate_info = personalization_engine.get_candidate_summary()
-        else:
-            candidate_info = "Generic candidate information"
-        
-        # Update the research task description with the actual job description and CV data
-        research_task.description = research_task.description.format(
-            job_description=job_description,
-            cv_summary=cv_summary
-        )
-        
-        # Update the writing task description with candidate information
-        writing_task.description = writing_task.description.format(
-            candidate_info=candidate_info
-        )
+            try:
+                cv_highlights = personalization_engine.get_cv_highlights(job_descriptions)
+            except Exception as e:
+                print(f"⚠️  Could not score CV against job descriptions: {e}")
         
-        # Update the review task description with candidate information
-        review_task.description = review_task.description.format(
-            candidate_info=candidate_info
-        )
+        # One set of inputs per job description; CrewAI fills the task placeholders
+        crew_inputs = [
+            {
+                "job_description": job_description,
+                "cv_highlights": "\n".join(f"- {chunk}" for chunk in highlights) or "None identified"
+            }
+            for job_description, highlights in zip(job_descriptions, cv_highlights)
+        ]
         
         print("✅ Tasks created successfully")
         print(f"📋 CV Summary: {cv_summary}")
@@ -288,9 +425,9 @@ def main():
     try:
         crew = Crew(
             agents=[researcher, writer, reviewer],
-            tasks=[research_task, writing_task, review_task],
+            tasks=list(tasks),
             process=Process.sequential,
-            verbose=True,
+            verbose=VERBOSE,
             llm=ollama_llm
         )
         print("✅ Crew created successfully")
@@ -301,13 +438,13 @@ def main():
     # Execute the crew
     try:
         print("🔄 Starting CrewAI workflow...")
-        print("\n📋 Step 1: Researching job description...")
-        result = crew.kickoff()
+        print("\n📋 Step 1: Analyzing the job, researching the company and drafting the email in parallel...")
+        results = asyncio.run(run_crews(crew, crew_inputs))
         print("\n✅ Email generation completed!")
-        print("\n📧 Final Email:")
-        print("=" * 50)
-        print(result)
-        print("=" * 50)
+        for job_description, result in zip(job_descriptions, results):
+            if email_cache is not None:
+                email_cache.set(pipeline_cache_key(job_description), str(result), expire=EMAIL_CACHE_TTL)
+            print_email(result)
         
     except Exception as e:
         print(f"❌ Error during execution: {e}")
@@ -319,4 +456,4 @@ def main():
         print("\nIf the issue persists, the error details above should help identify the problem.")
 
 if __name__ == "__main__":
-    main()
+    main(use_cache="--no-cache" not in sys.argv)
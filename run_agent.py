@@ -6,6 +6,18 @@ This script provides an easy way to start the agent system.
 
 import sys
 import os
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive session for the Ollama probes, with a couple of quick retries
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
 
 def main():
     """Main runner function"""
@@ -26,8 +38,8 @@ def main():
     # Check if Ollama is running
     print("🔍 Checking Ollama connection...")
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        # /api/tags also lists the installed models, so one request covers both checks
+        response = _SESSION.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code == 200:
             print("✅ Ollama is running")
         else:
@@ -41,17 +53,19 @@ def main():
     # Check if the required model is available
     print("🔍 Checking model availability...")
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        models = response.json().get("models", [])
+        models = orjson.loads(response.content).get("models", [])
         model_names = [model["name"] for model in models]
         
-        if "gemma3:1b" in model_names:
-            print("✅ gemma3:1b model is available")
-        else:
-            print("⚠️  gemma3:1b model not found")
-            print("Available models:", ", ".join(model_names))
-            print("You can pull it with: ollama pull gemma3:1b")
-            print("Or modify config/ollama_config.py to use a different model")
+        from config.ollama_config import RESEARCH_MODEL, WRITING_MODEL
+        for required in (RESEARCH_MODEL, WRITING_MODEL):
+            required = required.split("ollama/", 1)[-1]
+            if required in model_names:
+                print(f"✅ {required} model is available")
+            else:
+                print(f"⚠️  {required} model not found")
+                print("Available models:", ", ".join(model_names))
+                print(f"You can pull it with: ollama pull {required}")
+                print("Or modify config/ollama_config.py to use a different model")
     except Exception as e:
         print(f"⚠️  Could not check model availability: {e}")
     
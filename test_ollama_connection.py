@@ -10,45 +10,48 @@ import os
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def test_ollama_service():
+# Status lines are collected here and written out in one go by main()
+_LOG = []
+
+def check_ollama_service(log):
     """Test if Ollama service is running"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = requests.get("http://localhost:11434/api/tags", timeout=1.5)
         if response.status_code == 200:
-            print("✅ Ollama service is running")
+            log.append("✅ Ollama service is running")
             return True
         else:
-            print(f"⚠️  Ollama responded with status: {response.status_code}")
+            log.append(f"⚠️  Ollama responded with status: {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Cannot connect to Ollama: {e}")
+        log.append(f"❌ Cannot connect to Ollama: {e}")
         return False
 
-def test_crewai_ollama_integration():
+def check_crewai_ollama_integration(log):
     """Test CrewAI Ollama integration"""
     try:
         from langchain_ollama import OllamaLLM
         
-        print("🔍 Testing CrewAI Ollama integration...")
+        log.append("🔍 Testing CrewAI Ollama integration...")
         llm = OllamaLLM(
             model="ollama/gemma3:1b",
             base_url="http://localhost:11434"
         )
         
-        print("✅ CrewAI Ollama LLM instance created successfully")
+        log.append("✅ CrewAI Ollama LLM instance created successfully")
         return True
         
     except Exception as e:
-        print(f"❌ CrewAI Ollama integration failed: {e}")
+        log.append(f"❌ CrewAI Ollama integration failed: {e}")
         return False
 
-def test_agent_creation():
+def check_agent_creation(log):
     """Test if we can create CrewAI agents with Ollama"""
     try:
         from crewai import Agent
         from langchain_ollama import OllamaLLM
         
-        print("🔍 Testing agent creation with Ollama...")
+        log.append("🔍 Testing agent creation with Ollama...")
         
         llm = OllamaLLM(
             model="ollama/gemma3:1b",
@@ -64,35 +67,45 @@ def test_agent_creation():
             verbose=False
         )
         
-        print("✅ Agent created successfully with Ollama LLM")
+        log.append("✅ Agent created successfully with Ollama LLM")
         return True
         
     except Exception as e:
-        print(f"❌ Agent creation failed: {e}")
+        log.append(f"❌ Agent creation failed: {e}")
         return False
 
 def main():
     """Main test function"""
-    print("🧪 Testing Ollama and CrewAI Integration")
-    print("=" * 50)
+    try:
+        return _run_tests()
+    finally:
+        sys.stdout.write("\n".join(_LOG) + "\n")
+        sys.stdout.flush()
+
+def _run_tests():
+    """Run the checks in order, stopping at the first failure"""
+    _LOG.append("🧪 Testing Ollama and CrewAI Integration")
+    _LOG.append("=" * 50)
     
     # Test 1: Ollama service
-    if not test_ollama_service():
-        print("\n❌ Ollama service test failed")
-        print("Please ensure Ollama is running: ollama serve")
+    if not check_ollama_service(_LOG):
+        _LOG.append("\n❌ Ollama service test failed")
+        _LOG.append("Please ensure Ollama is running: ollama serve")
         return False
     
+    # Tests 2 and 3 run in sequence: both are dominated by importing crewai and
+    # langchain, CPU-bound work that threads can't overlap
     # Test 2: CrewAI Ollama integration
-    if not test_crewai_ollama_integration():
-        print("\n❌ CrewAI Ollama integration test failed")
+    if not check_crewai_ollama_integration(_LOG):
+        _LOG.append("\n❌ CrewAI Ollama integration test failed")
         return False
     
     # Test 3: Agent creation
-    if not test_agent_creation():
-        print("\n❌ Agent creation test failed")
+    if not check_agent_creation(_LOG):
+        _LOG.append("\n❌ Agent creation test failed")
         return False
     
-    print("\n🎉 All tests passed! Ollama is properly configured with CrewAI.")
+    _LOG.append("\n🎉 All tests passed! Ollama is properly configured with CrewAI.")
     return True
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+# Tests for the job application email system
@@ -0,0 +1,30 @@
+"""
+Tests for the regex-based CV parser.
+"""
+
+import unittest
+
+from tools.cv_parser import CVParser
+
+class SectionLookupTest(unittest.TestCase):
+    """Section bodies are found by trying each header in priority order"""
+    
+    def _parser(self, cv_text: str) -> CVParser:
+        parser = CVParser()
+        parser.cv_text = cv_text
+        return parser
+    
+    def test_header_priority_beats_position(self):
+        # 'EXPERIENCE' outranks 'EMPLOYMENT HISTORY' even though the latter comes first
+        cv_text = "EMPLOYMENT HISTORY\nvolunteer notes\n\n1\nEXPERIENCE\n2020 Engineer"
+        self.assertEqual(self._parser(cv_text)._get_section('experience'), "2020 Engineer")
+    
+    def test_skills_header_priority(self):
+        cv_text = "COMPETENCIES\nteamwork\n\n1\nSKILLS\nPython, SQL"
+        self.assertEqual(self._parser(cv_text)._get_section('skills'), "Python, SQL")
+    
+    def test_missing_section_is_empty(self):
+        self.assertEqual(self._parser("Jane Doe\nno sections here")._get_section('education'), "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests for the regex-based job description analyzer.
+"""
+
+import unittest
+from pathlib import Path
+
+from tools.job_analyzer import JOB_ANALYZER
+
+SAMPLE_DIR = Path(__file__).resolve().parent.parent / "data" / "job_descriptions"
+
+class SeniorityTest(unittest.TestCase):
+    """Seniority words about other people don't decide the role's level"""
+    
+    def _seniority(self, job_description: str) -> str:
+        return JOB_ANALYZER._analyze(job_description)["seniority_level"]
+    
+    def test_sample_software_engineer_is_senior(self):
+        # "Mentor junior developers" is a senior duty, not a junior role
+        job_description = (SAMPLE_DIR / "sample_software_engineer.txt").read_text(encoding="utf-8")
+        self.assertEqual(self._seniority(job_description), "Senior")
+    
+    def test_senior_outranks_junior(self):
+        self.assertEqual(self._seniority("Senior engineer; junior applicants also welcome"), "Senior")
+    
+    def test_junior_role(self):
+        self.assertEqual(self._seniority("Junior Python developer for our web team"), "Junior")
+    
+    def test_reporting_to_a_lead_is_not_senior(self):
+        self.assertEqual(self._seniority("Junior developer reporting to the lead engineer"), "Junior")
+        self.assertEqual(self._seniority("Backend developer, reports to a senior architect"), "Mid-level")
+    
+    def test_no_seniority_words_is_mid_level(self):
+        self.assertEqual(self._seniority("Python developer with 3+ years of experience"), "Mid-level")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,60 @@ Extracts structured information from CV/Resume files to personalize job applicat
 
 import os
 import re
-from typing import Dict, List, Any, Optional
+import json
+import hashlib
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-import PyPDF2
 from datetime import datetime
 
+# Patterns are compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}\b')
+_PHONE_RE = re.compile(r'(?<!\d)(\+?\d[\d\s\-()]{8,18}\d)(?!\d)')
+_LINKEDIN_RE = re.compile(r'(?:linkedin\.com/in/|LinkedIn:?\s*)([A-Za-z0-9\-_]+)', re.IGNORECASE)
+_JOB_RE = re.compile(
+    r'(\d{4}[-\s]*(?:present|now|current)?)[\s\-]*([^•\n]+?)(?:[\s\-]*([^•\n]+?))?(?=\d{4}|$)',
+    re.IGNORECASE
+)
+_DEGREE_RE = re.compile(r'(Bachelor|Master|PhD|BSc|MSc|MBA|Associate|Diploma)', re.IGNORECASE)
+_SKILL_SPLIT_RE = re.compile(r'[,•\n]+')
+
+# Set CV_DEBUG=1 to keep the first 1000 chars of CV text in the parsed data
+CV_DEBUG = os.getenv("CV_DEBUG", "0") == "1"
+
+# Part of the parsed-CV cache key; bump when the parsing logic changes
+CV_PARSER_VERSION = "3"
+
+def _section_res(headers: List[str]) -> Tuple[re.Pattern, ...]:
+    """Compile one section-body pattern per header, in priority order
+    
+    The headers are tried in turn and the first one found wins, so e.g. an
+    'EXPERIENCE' heading takes precedence over a later 'WORK EXPERIENCE' one.
+    """
+    return tuple(
+        re.compile(rf'{header}[:\s]*\n(.*?)(?=\n[A-Z\s]+\n|$)', re.IGNORECASE | re.DOTALL)
+        for header in headers
+    )
+
+_SECTION_RES = {
+    'experience': _section_res([
+        'EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY', 'PROFESSIONAL EXPERIENCE', 'CAREER HISTORY'
+    ]),
+    'skills': _section_res(['SKILLS', 'TECHNICAL SKILLS', 'COMPETENCIES', 'PROFICIENCIES', 'EXPERTISE']),
+    'education': _section_res(['EDUCATION', 'ACADEMIC BACKGROUND', 'QUALIFICATIONS'])
+}
+
+# Fallback skills searched for as whole tokens anywhere in the CV
+_COMMON_SKILLS = [
+    'Python', 'JavaScript', 'Java', 'C++', 'React', 'Angular', 'Vue',
+    'Node.js', 'Django', 'Flask', 'AWS', 'Docker', 'Kubernetes',
+    'SQL', 'MongoDB', 'Git', 'Linux', 'Agile', 'Scrum'
+]
+_COMMON_SKILLS_BY_LOWER = {skill.lower(): skill for skill in _COMMON_SKILLS}
+_COMMON_SKILLS_RE = re.compile(
+    rf'(?<!\w)({"|".join(map(re.escape, _COMMON_SKILLS))})(?!\w)',
+    re.IGNORECASE
+)
+
 class CVParser:
     """Parse CV/Resume files and extract structured information"""
     
@@ -19,6 +68,7 @@ class CVParser:
         self.cv_file = None
         self.cv_text = ""
         self.parsed_data = {}
+        self._sections = {}
     
     def find_cv_file(self) -> Optional[str]:
         """Find the first CV file in the CV folder"""
@@ -39,17 +89,30 @@ class CVParser:
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF file"""
+        import PyPDF2  # Only needed on a cache miss, so keep it off the import path
+        
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                # Collect pages and join once; repeated += can copy the text per page
+                parts = [page.extract_text() or "" for page in pdf_reader.pages]
+                return "\n".join(parts)
         except Exception as e:
             print(f"❌ Error reading PDF: {e}")
             return ""
     
+    def _get_section(self, name: str) -> str:
+        """Return the body of a CV section, splitting the text into sections on first use"""
+        if not self._sections:
+            for section, patterns in _SECTION_RES.items():
+                self._sections[section] = ""
+                for pattern in patterns:
+                    match = pattern.search(self.cv_text)
+                    if match:
+                        self._sections[section] = match.group(1)
+                        break
+        return self._sections[name]
+    
     def extract_personal_info(self) -> Dict[str, str]:
         """Extract personal information from CV text"""
         personal_info = {
@@ -61,25 +124,22 @@ class CVParser:
         }
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, self.cv_text)
+        emails = _EMAIL_RE.findall(self.cv_text)
         if emails:
             personal_info['email'] = emails[0]
         
         # Extract phone number
-        phone_pattern = r'(\+?[\d\s\-\(\)]{10,})'
-        phones = re.findall(phone_pattern, self.cv_text)
+        phones = _PHONE_RE.findall(self.cv_text)
         if phones:
             personal_info['phone'] = phones[0].strip()
         
         # Extract LinkedIn (common patterns)
-        linkedin_pattern = r'(?:linkedin\.com/in/|LinkedIn:?\s*)([A-Za-z0-9\-_]+)'
-        linkedin_matches = re.findall(linkedin_pattern, self.cv_text, re.IGNORECASE)
+        linkedin_matches = _LINKEDIN_RE.findall(self.cv_text)
         if linkedin_matches:
             personal_info['linkedin'] = f"linkedin.com/in/{linkedin_matches[0]}"
         
         # Try to extract name from first few lines
-        lines = self.cv_text.split('\n')[:10]
+        lines = self.cv_text.split('\n', 10)[:10]  # Don't split the whole CV for 10 lines
         for line in lines:
             line = line.strip()
             if line and len(line.split()) <= 4 and not any(char in line for char in '@()'):
@@ -93,28 +153,15 @@ class CVParser:
         """Extract work experience from CV text"""
         experience = []
         
-        # Common experience section headers
-        experience_headers = [
-            r'EXPERIENCE', r'WORK EXPERIENCE', r'EMPLOYMENT HISTORY',
-            r'PROFESSIONAL EXPERIENCE', r'CAREER HISTORY'
-        ]
-        
         # Look for experience section
-        experience_text = ""
-        for header in experience_headers:
-            pattern = rf'{header}[:\s]*\n(.*?)(?=\n[A-Z\s]+\n|$)'
-            match = re.search(pattern, self.cv_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                experience_text = match.group(1)
-                break
+        experience_text = self._get_section('experience')
         
         if not experience_text:
             # Fallback: look for common job patterns
             experience_text = self.cv_text
         
         # Extract job entries (look for date patterns and company names)
-        job_pattern = r'(\d{4}[-\s]*(?:present|now|current)?)[\s\-]*([^•\n]+?)(?:[\s\-]*([^•\n]+?))?(?=\d{4}|$)'
-        jobs = re.findall(job_pattern, experience_text, re.IGNORECASE)
+        jobs = _JOB_RE.findall(experience_text)
         
         for job in jobs:
             if len(job) >= 2:
@@ -129,62 +176,33 @@ class CVParser:
     
     def extract_skills(self) -> List[str]:
         """Extract skills from CV text"""
-        skills = []
-        
-        # Common skills section headers
-        skills_headers = [
-            r'SKILLS', r'TECHNICAL SKILLS', r'COMPETENCIES',
-            r'PROFICIENCIES', r'EXPERTISE'
-        ]
+        skills = {}  # Ordered set: keeps first-seen order while deduplicating
         
         # Look for skills section
-        skills_text = ""
-        for header in skills_headers:
-            pattern = rf'{header}[:\s]*\n(.*?)(?=\n[A-Z\s]+\n|$)'
-            match = re.search(pattern, self.cv_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                skills_text = match.group(1)
-                break
+        skills_text = self._get_section('skills')
         
         if skills_text:
             # Extract skills (look for comma-separated or bullet-pointed lists)
-            skill_items = re.split(r'[,•\n]+', skills_text)
+            skill_items = _SKILL_SPLIT_RE.split(skills_text)
             for skill in skill_items:
                 skill = skill.strip()
                 if skill and len(skill) > 2 and len(skill) < 50:
-                    skills.append(skill)
+                    skills[skill] = None
         
         # Fallback: look for common technical skills throughout the text
         if not skills:
-            common_skills = [
-                'Python', 'JavaScript', 'Java', 'C++', 'React', 'Angular', 'Vue',
-                'Node.js', 'Django', 'Flask', 'AWS', 'Docker', 'Kubernetes',
-                'SQL', 'MongoDB', 'Git', 'Linux', 'Agile', 'Scrum'
-            ]
-            
-            for skill in common_skills:
-                if re.search(rf'\b{skill}\b', self.cv_text, re.IGNORECASE):
-                    skills.append(skill)
-        
-        return list(set(skills))  # Remove duplicates
+            # Single pass over the text for all common skills
+            for match in _COMMON_SKILLS_RE.findall(self.cv_text):
+                skills[_COMMON_SKILLS_BY_LOWER[match.lower()]] = None
+        
+        return list(skills)
     
     def extract_education(self) -> List[Dict[str, str]]:
         """Extract education information from CV text"""
         education = []
         
-        # Common education section headers
-        education_headers = [
-            r'EDUCATION', r'ACADEMIC BACKGROUND', r'QUALIFICATIONS'
-        ]
-        
         # Look for education section
-        education_text = ""
-        for header in education_headers:
-            pattern = rf'{header}[:\s]*\n(.*?)(?=\n[A-Z\s]+\n|$)'
-            match = re.search(pattern, self.cv_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                education_text = match.group(1)
-                break
+        education_text = self._get_section('education')
         
         if education_text:
             # Extract degree and institution
@@ -193,8 +211,7 @@ class CVParser:
                 line = line.strip()
                 if line and len(line) > 10:
                     # Look for degree patterns
-                    degree_pattern = r'(Bachelor|Master|PhD|BSc|MSc|MBA|Associate|Diploma)'
-                    degree_match = re.search(degree_pattern, line, re.IGNORECASE)
+                    degree_match = _DEGREE_RE.search(line)
                     
                     if degree_match:
                         education.append({
@@ -214,9 +231,27 @@ class CVParser:
         
         self.cv_file = cv_path
         
+        # Reuse the previous result if this exact file was parsed before by this parser
+        # version with the same CV_DEBUG setting
+        # (blake2b: fast, and no cryptographic strength is needed for a cache key)
+        with open(cv_path, 'rb') as file:
+            cv_hasher = hashlib.blake2b(file.read(), digest_size=16)
+        cv_hasher.update(f"\0{CV_PARSER_VERSION}\0{CV_DEBUG}".encode('utf-8'))
+        cv_hash = cv_hasher.hexdigest()
+        cache_file = self.cv_folder / ".cache" / f"{cv_hash}.json"
+        if cache_file.exists():
+            try:
+                with open(cache_file, encoding='utf-8') as file:
+                    self.parsed_data = json.load(file)
+                print(f"✅ CV loaded from cache: {cache_file.name}")
+                return self.parsed_data
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable CV cache: {e}")
+        
         # Extract text
         if cv_path.lower().endswith('.pdf'):
             self.cv_text = self.extract_text_from_pdf(cv_path)
+            self._sections = {}
         else:
             # For other formats, we'll implement later
             print(f"⚠️  File format {Path(cv_path).suffix} not yet supported")
@@ -231,9 +266,11 @@ class CVParser:
             'personal_info': self.extract_personal_info(),
             'experience': self.extract_experience(),
             'skills': self.extract_skills(),
-            'education': self.extract_education(),
-            'raw_text': self.cv_text[:1000]  # First 1000 chars for debugging
+            'education': self.extract_education()
         }
+        # The raw text only helps when debugging the parser; keep it out of agent prompts
+        if CV_DEBUG:
+            self.parsed_data['raw_text'] = self.cv_text[:1000]  # First 1000 chars
         
         print(f"✅ CV parsed successfully:")
         print(f"   - Personal Info: {len(self.parsed_data['personal_info'])} fields")
@@ -241,6 +278,16 @@ class CVParser:
         print(f"   - Skills: {len(self.parsed_data['skills'])} skills")
         print(f"   - Education: {len(self.parsed_data['education'])} entries")
         
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a partial cache
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as file:
+                json.dump(self.parsed_data, file)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️  Could not write CV cache: {e}")
+        
         return self.parsed_data
     
     def get_summary(self) -> str:
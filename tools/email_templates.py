@@ -4,57 +4,16 @@ This tool manages email templates and customizes them based on job requirements.
 """
 
 from crewai.tools import BaseTool
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import functools
+import logging
 import re
 
-class EmailTemplateManager(BaseTool):
-    """Tool for managing and customizing email templates"""
-    
-    name: str = "Email Template Manager"
-    description: str = "Manages email templates and customizes them based on job requirements"
-    
-    def _run(self, template_type: str, customization_data: Dict[str, Any]) -> str:
-        """
-        Return customized email template based on template type and customization data
-        
-        Args:
-            template_type (str): Type of email template to use
-            customization_data (Dict[str, Any]): Data to customize the template with
-            
-        Returns:
-            str: Customized email template
-        """
-        try:
-            # Get the base template
-            base_template = self._get_base_template(template_type)
-            
-            # Customize the template
-            customized_email = self._customize_template(base_template, customization_data)
-            
-            return customized_email
-            
-        except Exception as e:
-            print(f"Error managing email template: {e}")
-            # Return a basic template as fallback
-            return self._get_fallback_template(customization_data)
-    
-    def _get_base_template(self, template_type: str) -> str:
-        """Get the base template for the specified type"""
-        templates = {
-            "software_engineer": self._get_software_engineer_template(),
-            "data_scientist": self._get_data_scientist_template(),
-            "product_manager": self._get_product_manager_template(),
-            "designer": self._get_designer_template(),
-            "marketing": self._get_marketing_template(),
-            "sales": self._get_sales_template(),
-            "general": self._get_general_template()
-        }
-        
-        return templates.get(template_type, templates["general"])
-    
-    def _get_software_engineer_template(self) -> str:
-        """Software engineer specific template"""
-        return """
+logger = logging.getLogger(__name__)
+
+# Base email templates, one per role type
+# Software engineer specific template
+_SOFTWARE_ENGINEER_TEMPLATE = """
 Dear {hiring_manager},
 
 I am writing to express my strong interest in the {role_title} position at {company}. With my background in {key_skills} and experience in {relevant_experience}, I believe I would be an excellent fit for your team.
@@ -72,12 +31,13 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_data_scientist_template(self) -> str:
-        """Data scientist specific template"""
-        return """
+
+# Data scientist specific template
+_DATA_SCIENTIST_TEMPLATE = """
 Dear {hiring_manager},
 
 I am excited to apply for the {role_title} position at {company}. My expertise in {key_skills} and passion for {industry_focus} align perfectly with your team's mission.
@@ -95,12 +55,13 @@ Thank you for your time and consideration. I look forward to discussing this opp
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_product_manager_template(self) -> str:
-        """Product manager specific template"""
-        return """
+
+# Product manager specific template
+_PRODUCT_MANAGER_TEMPLATE = """
 Dear {hiring_manager},
 
 I am writing to express my interest in the {role_title} position at {company}. My experience in {key_skills} and passion for {industry_focus} make me an ideal candidate for this role.
@@ -118,12 +79,13 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_designer_template(self) -> str:
-        """Designer specific template"""
-        return """
+
+# Designer specific template
+_DESIGNER_TEMPLATE = """
 Dear {hiring_manager},
 
 I am thrilled to apply for the {role_title} position at {company}. My creative background in {key_skills} and passion for {industry_focus} make me an ideal fit for your design team.
@@ -141,12 +103,13 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_marketing_template(self) -> str:
-        """Marketing specific template"""
-        return """
+
+# Marketing specific template
+_MARKETING_TEMPLATE = """
 Dear {hiring_manager},
 
 I am writing to express my interest in the {role_title} position at {company}. My expertise in {key_skills} and passion for {industry_focus} align perfectly with your marketing goals.
@@ -164,12 +127,13 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_sales_template(self) -> str:
-        """Sales specific template"""
-        return """
+
+# Sales specific template
+_SALES_TEMPLATE = """
 Dear {hiring_manager},
 
 I am excited to apply for the {role_title} position at {company}. My proven track record in {key_skills} and passion for {industry_focus} make me an ideal candidate for your sales team.
@@ -187,12 +151,13 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
-    
-    def _get_general_template(self) -> str:
-        """General template for any role"""
-        return """
+
+# General template for any role
+_GENERAL_TEMPLATE = """
 Dear {hiring_manager},
 
 I am writing to express my interest in the {role_title} position at {company}. With my background in {key_skills} and experience in {relevant_experience}, I believe I would be an excellent fit for your team.
@@ -210,117 +175,220 @@ Thank you for considering my application. I look forward to discussing how I can
 Best regards,
 {your_name}
 
-{contact_info}
+Phone: {phone}
+Email: {email}
+LinkedIn: {linkedin}
         """
+
+# Minimal email used when customizing a template fails
+_FALLBACK_TEMPLATE = """
+Dear Hiring Manager,
+
+I am writing to express my interest in the position at {company}.
+
+I believe my skills and experience would be valuable to your team.
+
+Thank you for considering my application.
+
+Best regards,
+{your_name}
+        """
+
+# Base templates by type
+_TEMPLATES = {
+    "software_engineer": _SOFTWARE_ENGINEER_TEMPLATE,
+    "data_scientist": _DATA_SCIENTIST_TEMPLATE,
+    "product_manager": _PRODUCT_MANAGER_TEMPLATE,
+    "designer": _DESIGNER_TEMPLATE,
+    "marketing": _MARKETING_TEMPLATE,
+    "sales": _SALES_TEMPLATE,
+    "general": _GENERAL_TEMPLATE
+}
+
+class _SafeFormatDict(dict):
+    """Mapping that leaves unknown placeholders in place
     
-    def _customize_template(self, template: str, data: Dict[str, Any]) -> str:
-        """Customize the template with the provided data"""
-        try:
-            # Ensure all required fields have values
-            default_values = {
-                "hiring_manager": "Hiring Manager",
-                "role_title": "Software Engineer",
-                "company": "TechCorp Inc.",
-                "key_skills": "software development and problem-solving",
-                "relevant_experience": "building scalable applications",
-                "company_specific_paragraph": self._generate_company_paragraph(data),
-                "experience_highlight_paragraph": self._generate_experience_paragraph(data),
-                "industry_focus": data.get("industry", "technology"),
-                "company_culture": data.get("company_culture", "innovative and collaborative"),
-                "technical_highlight_paragraph": self._generate_technical_paragraph(data),
-                "data_science_highlight_paragraph": self._generate_data_science_paragraph(data),
-                "product_management_highlight_paragraph": self._generate_product_management_paragraph(data),
-                "design_highlight_paragraph": self._generate_design_paragraph(data),
-                "marketing_highlight_paragraph": self._generate_marketing_paragraph(data),
-                "sales_highlight_paragraph": self._generate_sales_paragraph(data),
-                "general_highlight_paragraph": self._generate_general_highlight_paragraph(data),
-                "your_name": data.get("your_name", "Your Name"),
-                "contact_info": self._generate_contact_info(data)
-            }
-            
-            # Update with provided data
-            default_values.update(data)
-            
-            # Fill the template
-            customized = template
-            for key, value in default_values.items():
-                placeholder = "{" + key + "}"
-                customized = customized.replace(placeholder, str(value))
-            
-            return customized
-            
-        except Exception as e:
-            print(f"Error customizing template: {e}")
-            return template
-    
-    def _generate_company_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate company-specific paragraph"""
-        company = data.get("company", "TechCorp Inc.")
-        industry = data.get("industry", "technology")
-        
-        return f"I have been following {company}'s impressive growth in the {industry} sector and am particularly impressed by your innovative approach to solving complex challenges."
-    
-    def _generate_experience_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate experience highlight paragraph"""
-        key_skills = data.get("key_requirements", ["Python", "Problem-solving"])
-        skills_text = ", ".join(key_skills[:3])  # Use top 3 skills
-        
-        return f"In my previous roles, I have successfully utilized {skills_text} to deliver high-quality solutions that drive business value. I am confident that my technical expertise and problem-solving abilities would be valuable to your team."
+    Values in `lazy` are zero-argument callables, only called (once) when the
+    template actually looks their key up.
+    """
     
-    def _generate_technical_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate technical highlight paragraph"""
-        key_skills = data.get("key_requirements", ["Python", "Problem-solving"])
-        skills_text = ", ".join(key_skills[:3])
-        
-        return f"My technical background includes deep expertise in {skills_text}, and I am always eager to learn new technologies and methodologies. I believe in writing clean, maintainable code and collaborating effectively with cross-functional teams."
+    def __init__(self, values: Dict[str, Any] = None, lazy: Dict[str, Callable[[], str]] = None):
+        super().__init__(values or {})
+        self._lazy = lazy or {}
     
-    def _generate_data_science_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate data science highlight paragraph"""
-        return "I have a proven track record of turning complex data into actionable insights and building machine learning models that drive business decisions. I am passionate about using data to solve real-world problems."
+    def __missing__(self, key: str) -> str:
+        producer = self._lazy.get(key)
+        if producer is None:
+            return "{" + key + "}"
+        value = self[key] = producer()
+        return value
+
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+def _condense(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a template into (literal, placeholder name or None) segments"""
+    parts = _PLACEHOLDER_RE.split(template)
+    # split() alternates literal, name, literal, ...; the last literal has no placeholder
+    return list(zip(parts[0::2], parts[1::2] + [None]))
+
+def _compile_filler(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Generate a function that fills this one template from a values mapping
     
-    def _generate_product_management_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate product management highlight paragraph"""
-        return "I have successfully led product development from ideation to launch, working closely with engineering, design, and business teams to deliver products that users love and that drive business growth."
+    The literals are baked into the function body, so rendering is a single
+    join with one lookup per placeholder and no parsing or segment iteration.
+    """
+    parts = []
+    for literal, name in _condense(template):
+        if literal:
+            parts.append(repr(literal))
+        if name is not None:
+            parts.append(f"str(values[{name!r}])")
+    namespace = {}
+    exec(f"def fill(values):\n    return ''.join(({', '.join(parts)},))", namespace)
+    return namespace["fill"]
+
+# Templates are turned into fill functions once at import
+_TEMPLATE_FILLERS = {
+    template_type: _compile_filler(template) for template_type, template in _TEMPLATES.items()
+}
+_FALLBACK_FILLER = _compile_filler(_FALLBACK_TEMPLATE)
+
+# Role-specific highlight paragraphs that don't depend on the job data
+_STATIC_PARAGRAPHS = {
+    "data_science_highlight_paragraph": "I have a proven track record of turning complex data into actionable insights and building machine learning models that drive business decisions. I am passionate about using data to solve real-world problems.",
+    "product_management_highlight_paragraph": "I have successfully led product development from ideation to launch, working closely with engineering, design, and business teams to deliver products that users love and that drive business growth.",
+    "design_highlight_paragraph": "I have a strong foundation in user-centered design principles and have created intuitive, beautiful interfaces that enhance user experience and drive engagement. I believe in the power of design to solve complex problems.",
+    "marketing_highlight_paragraph": "I have successfully developed and executed marketing strategies that drive brand awareness, lead generation, and revenue growth. I am data-driven and always optimize campaigns based on performance metrics.",
+    "sales_highlight_paragraph": "I have consistently exceeded sales targets and built strong relationships with clients. I am skilled at understanding customer needs and positioning solutions that provide real value.",
+    "general_highlight_paragraph": "I am a results-oriented professional who thrives in dynamic environments. I am passionate about continuous learning and always strive to deliver exceptional results."
+}
+
+@functools.lru_cache(maxsize=256)
+def _company_paragraph(company: str, industry: str) -> str:
+    """Generate company-specific paragraph"""
+    return f"I have been following {company}'s impressive growth in the {industry} sector and am particularly impressed by your innovative approach to solving complex challenges."
+
+@functools.lru_cache(maxsize=256)
+def _experience_paragraph(skills: Tuple[str, ...]) -> str:
+    """Generate experience highlight paragraph from the top skills"""
+    return f"In my previous roles, I have successfully utilized {', '.join(skills)} to deliver high-quality solutions that drive business value. I am confident that my technical expertise and problem-solving abilities would be valuable to your team."
+
+@functools.lru_cache(maxsize=256)
+def _technical_paragraph(skills: Tuple[str, ...]) -> str:
+    """Generate technical highlight paragraph from the top skills"""
+    return f"My technical background includes deep expertise in {', '.join(skills)}, and I am always eager to learn new technologies and methodologies. I believe in writing clean, maintainable code and collaborating effectively with cross-functional teams."
+
+class EmailTemplateManager(BaseTool):
+    """Tool for managing and customizing email templates"""
     
-    def _generate_design_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate design highlight paragraph"""
-        return "I have a strong foundation in user-centered design principles and have created intuitive, beautiful interfaces that enhance user experience and drive engagement. I believe in the power of design to solve complex problems."
+    name: str = "Email Template Manager"
+    description: str = "Manages email templates and customizes them based on job requirements"
     
-    def _generate_marketing_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate marketing highlight paragraph"""
-        return "I have successfully developed and executed marketing strategies that drive brand awareness, lead generation, and revenue growth. I am data-driven and always optimize campaigns based on performance metrics."
+    def _run(self, template_type: str, customization_data: Dict[str, Any]) -> str:
+        """
+        Return customized email template based on template type and customization data
+        
+        Args:
+            template_type (str): Type of email template to use
+            customization_data (Dict[str, Any]): Data to customize the template with
+            
+        Returns:
+            str: Customized email template
+        """
+        # Agents sometimes pass None or a string here; render the defaults instead
+        data = customization_data if isinstance(customization_data, dict) else {}
+        
+        try:
+            # Identical calls (e.g. agent retries) are served from the cache
+            return _render_cached(template_type, _DataKey(data))
+            
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Malformed customization values (e.g. a non-list key_requirements)
+            logger.warning("Error managing email template", exc_info=True)
+            # Return a basic template as fallback
+            return self._get_fallback_template(data)
     
-    def _generate_sales_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate sales highlight paragraph"""
-        return "I have consistently exceeded sales targets and built strong relationships with clients. I am skilled at understanding customer needs and positioning solutions that provide real value."
+    def _render(self, template_type: str, customization_data: Dict[str, Any]) -> str:
+        """Fill the base template for the type with the customization data"""
+        base_template = self._get_template_filler(template_type)
+        return self._customize_template(base_template, customization_data)
     
-    def _generate_general_highlight_paragraph(self, data: Dict[str, Any]) -> str:
-        """Generate general highlight paragraph"""
-        return "I am a results-oriented professional who thrives in dynamic environments. I am passionate about continuous learning and always strive to deliver exceptional results."
+    def _get_template_filler(self, template_type: str) -> Callable[[Dict[str, Any]], str]:
+        """Get the fill function for the base template of the specified type"""
+        return _TEMPLATE_FILLERS.get(template_type, _TEMPLATE_FILLERS["general"])
     
-    def _generate_contact_info(self, data: Dict[str, Any]) -> str:
-        """Generate contact information"""
-        return """
-Phone: {phone}
-Email: {email}
-LinkedIn: {linkedin}
-        """.format(
-            phone=data.get("phone", "Your Phone"),
-            email=data.get("email", "your.email@example.com"),
-            linkedin=data.get("linkedin", "linkedin.com/in/yourprofile")
-        )
+    def _customize_template(self, template: Callable[[Dict[str, Any]], str], data: Dict[str, Any]) -> str:
+        """Customize the template with the provided data; errors propagate to _run's fallback"""
+        # Top 3 skills, as a tuple so the paragraph helpers can cache on it
+        key_requirements = data.get("key_requirements")
+        if key_requirements is None:
+            key_requirements = ["Python", "Problem-solving"]
+        elif isinstance(key_requirements, str):
+            key_requirements = [key_requirements]
+        top_skills = tuple(str(skill) for skill in key_requirements[:3])
+        
+        # Ensure all required fields have values
+        default_values = _SafeFormatDict({
+            "hiring_manager": "Hiring Manager",
+            "role_title": "Software Engineer",
+            "company": "TechCorp Inc.",
+            "key_skills": "software development and problem-solving",
+            "relevant_experience": "building scalable applications",
+            "industry_focus": data.get("industry", "technology"),
+            "company_culture": data.get("company_culture", "innovative and collaborative"),
+            **_STATIC_PARAGRAPHS,
+            "your_name": data.get("your_name", "Your Name"),
+            "phone": data.get("phone", "Your Phone"),
+            "email": data.get("email", "your.email@example.com"),
+            "linkedin": data.get("linkedin", "linkedin.com/in/yourprofile")
+        }, lazy={
+            # Each template uses only some of these, so build them on demand
+            "company_specific_paragraph": lambda: _company_paragraph(
+                data.get("company", "TechCorp Inc."), data.get("industry", "technology")
+            ),
+            "experience_highlight_paragraph": lambda: _experience_paragraph(top_skills),
+            "technical_highlight_paragraph": lambda: _technical_paragraph(top_skills)
+        })
+        
+        # Update with provided data
+        default_values.update(data)
+        
+        # Fill the template; unknown placeholders are left in place
+        return template(default_values)
     
     def _get_fallback_template(self, data: Dict[str, Any]) -> str:
-        """Get a fallback template if customization fails"""
-        return f"""
-Dear Hiring Manager,
+        """Get a fallback template if customization fails; only reads the two fields it shows"""
+        return _FALLBACK_FILLER({
+            "company": data.get("company", "your company"),
+            "your_name": data.get("your_name", "Your Name")
+        })
 
-I am writing to express my interest in the position at {data.get('company', 'your company')}.
 
-I believe my skills and experience would be valuable to your team.
+# Shared instance: the tool holds no per-call state, so callers and agents can reuse it
+EMAIL_TEMPLATES = EmailTemplateManager()
 
-Thank you for considering my application.
 
-Best regards,
-{data.get('your_name', 'Your Name')}
-        """
+class _DataKey:
+    """Hashable cache key for customization data, compared by its repr
+    
+    The data itself is carried along unchanged, so emails render from the original
+    values (a list still formats as ['a', 'b']) and keys of any type are fine.
+    """
+    
+    __slots__ = ("data", "_repr")
+    
+    def __init__(self, data: Any):
+        self.data = data
+        self._repr = repr(data)
+    
+    def __hash__(self) -> int:
+        return hash(self._repr)
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _DataKey) and self._repr == other._repr
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(template_type: str, data_key: _DataKey) -> str:
+    """Render an email once per (template type, customization data) pair"""
+    return EMAIL_TEMPLATES._render(template_type, data_key.data)
@@ -5,8 +5,137 @@ This tool analyzes job descriptions and extracts key information for email perso
 
 from crewai.tools import BaseTool
 from typing import Dict, Any, List
+import functools
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+# Descriptions shorter than this get the default analysis
+_MIN_JD_LENGTH = 32
+# Title, company and location are only searched for in the first _HEAD_CHARS chars
+_HEAD_CHARS = 4096
+
+# Patterns are compiled once at import and tried in order. The free-text
+# runs before each suffix are capped at 60 chars and the suffix must end on a
+# word boundary, so a long JD without a match can't trigger quadratic backtracking
+_ROLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:Position|Role|Job|We are looking for|Seeking|Hiring)\s*:?\s*([A-Za-z\s&]{1,60}(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator)\b)',
+    r'([A-Za-z\s&]{1,60}(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator)\b)\s*position',
+    r'([A-Za-z\s&]{1,60}(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator)\b)'
+)]
+_COMPANY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:at|with|join)\s+([A-Z][a-zA-Z\s&]{1,60}(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions)\b)',
+    r'([A-Z][a-zA-Z\s&]{1,60}(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions)\b)',
+    r'(?:Company|Organization):\s*([A-Z][a-zA-Z\s&]{0,60})'
+)]
+_EXP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\+?\s*years?\s*experience',
+    r'experience\s*level:\s*([A-Za-z\s]+)',
+    r'(\d+)\+?\s*years?\s*in\s*([A-Za-z\s]+)'
+)]
+
+_TECH_SKILLS = (
+    "Python", "JavaScript", "Java", "C++", "C#", "React", "Angular", "Vue",
+    "Node.js", "Django", "Flask", "AWS", "Azure", "GCP", "Docker", "Kubernetes",
+    "SQL", "MongoDB", "PostgreSQL", "Git", "Linux", "Agile", "Scrum"
+)
+# Lookarounds instead of \b so skills ending in symbols (C++, C#) still match
+_TECH_SKILLS_RE = re.compile(
+    rf'(?<!\w)({"|".join(map(re.escape, _TECH_SKILLS))})(?!\w)',
+    re.IGNORECASE
+)
+_LOCATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:in|at|based in)\s+([A-Z][a-zA-Z\s,]{1,60}(?:CA|NY|TX|FL|WA|Remote|Hybrid)\b)',
+    r'Location:\s*([A-Z][a-zA-Z\s,]{0,60})',
+    r'([A-Z][a-zA-Z\s,]{1,60}(?:CA|NY|TX|FL|WA|Remote|Hybrid)\b)'
+)]
+
+# Keyword tables; where only one result is kept, the first listed keyword wins
+_CULTURE_KEYWORDS = {
+    "fast-paced": "Fast-paced startup environment",
+    "startup": "Fast-paced startup environment",
+    "innovative": "Innovative and creative culture",
+    "collaborative": "Collaborative team environment",
+    "remote": "Remote-first culture",
+    "flexible": "Flexible work environment",
+    "growth": "Growth-oriented company",
+    "learning": "Learning-focused organization"
+}
+_INDUSTRIES = {
+    "software": "Technology",
+    "tech": "Technology",
+    "ai": "Artificial Intelligence",
+    "machine learning": "Machine Learning",
+    "data": "Data Science",
+    "finance": "Financial Services",
+    "healthcare": "Healthcare",
+    "ecommerce": "E-commerce",
+    "education": "Education"
+}
+_BENEFIT_KEYWORDS = {
+    "health insurance": "Health insurance",
+    "dental": "Dental coverage",
+    "vision": "Vision coverage",
+    "401k": "401(k) retirement plan",
+    "flexible": "Flexible work arrangements",
+    "remote": "Remote work options",
+    "unlimited pto": "Unlimited PTO",
+    "professional development": "Professional development",
+    "learning": "Learning opportunities"
+}
+
+_SALARY_HINTS = (
+    ("Competitive salary", ("competitive", "market rate", "attractive")),
+    ("Equity compensation included", ("equity", "stock options", "ownership"))
+)
+
+# Seniority words, matched as whole words ("internal" is not "intern");
+# any Senior word outranks any Junior word
+_SENIORITY_LEVELS = {
+    "senior": "Senior", "lead": "Senior", "principal": "Senior", "architect": "Senior",
+    "junior": "Junior", "entry": "Junior", "graduate": "Junior", "intern": "Junior"
+}
+_SENIORITY_RE = re.compile(rf'\b({"|".join(_SENIORITY_LEVELS)})\b', re.IGNORECASE)
+
+# Seniority words that describe other people rather than the role: mentoring or
+# leading juniors is a senior duty, and reporting to a lead says nothing about the role
+_MENTORING_RE = re.compile(
+    r'\b(?:mentor|mentors|mentoring|coach|coaches|coaching|guide|guides|guiding|'
+    r'supervise|supervises|supervising|manage|manages|managing|lead|leads|leading|'
+    r'train|trains|training)\s+(?:(?:a|the|our|other)\s+)?(?:team\s+of\s+)?'
+    r'(?:junior|entry[- ]level|graduate|intern)s?\b',
+    re.IGNORECASE
+)
+_REPORTING_RE = re.compile(
+    r'\breport(?:s|ing)?\s+(?:directly\s+)?(?:to|into)\s+(?:(?:a|the|our)\s+)?'
+    r'(?:senior|lead|principal)(?:\s+architect)?\b',
+    re.IGNORECASE
+)
+
+def _keyword_scanner(keywords, whole_words) -> re.Pattern:
+    """Compile one pattern reporting every, possibly overlapping, keyword occurrence
+    
+    `keywords` match anywhere (like `kw in text`); `whole_words` only as whole words.
+    """
+    # The lookahead makes each match zero-width, so overlapping hits are all found.
+    # Only one alternative is captured per position, so no keyword may be a prefix
+    # of another
+    alternatives = [re.escape(keyword) for keyword in keywords]
+    alternatives += [rf'\b{re.escape(word)}\b' for word in whole_words]
+    return re.compile(rf'(?=({"|".join(alternatives)}))', re.IGNORECASE)
+
+# Every keyword table in one scanner, so the description is walked once
+_KEYWORD_RE = _keyword_scanner(
+    {
+        **_CULTURE_KEYWORDS,
+        **_INDUSTRIES,
+        **_BENEFIT_KEYWORDS,
+        **{word: None for _, words in _SALARY_HINTS for word in words}
+    },
+    _SENIORITY_LEVELS
+)
+
 class JobDescriptionAnalyzer(BaseTool):
     """Tool for analyzing job descriptions and extracting key information"""
     
@@ -24,37 +153,63 @@ class JobDescriptionAnalyzer(BaseTool):
             Dict[str, Any]: Structured analysis of the job description
         """
         try:
-            # Extract basic information
-            analysis = {
-                "role_title": self._extract_role_title(job_description),
-                "company": self._extract_company(job_description),
-                "key_requirements": self._extract_requirements(job_description),
-                "company_culture": self._extract_culture_hints(job_description),
-                "industry": self._extract_industry(job_description),
-                "seniority_level": self._extract_seniority(job_description),
-                "location": self._extract_location(job_description),
-                "salary_hints": self._extract_salary_hints(job_description),
-                "benefits": self._extract_benefits(job_description)
-            }
+            # Too short to say anything the defaults don't already
+            if not job_description or len(job_description) < _MIN_JD_LENGTH:
+                return self._get_default_analysis()
             
-            return analysis
+            # Cached per description; lists are copied so callers can't
+            # mutate the cached entry
+            return {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in _analyze_cached(job_description)
+            }
             
-        except Exception as e:
-            print(f"Error analyzing job description: {e}")
+        except (AttributeError, TypeError, re.error):
+            # Not a usable string (e.g. None or a non-text payload from the agent)
+            logger.warning("Error analyzing job description", exc_info=True)
             # Return default analysis
             return self._get_default_analysis()
     
+    def _run_batch(self, job_descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze many job descriptions, analyzing each distinct text only once
+        
+        Args:
+            job_descriptions (List[str]): The job description texts to analyze
+            
+        Returns:
+            List[Dict[str, Any]]: One analysis per input, in input order
+        """
+        analyses = {jd: self._run(jd) for jd in dict.fromkeys(job_descriptions)}
+        # Duplicates get their own copy of the lists so results stay independent
+        return [
+            {key: list(value) if isinstance(value, list) else value for key, value in analyses[jd].items()}
+            for jd in job_descriptions
+        ]
+    
+    def _analyze(self, job_description: str) -> Dict[str, Any]:
+        """Extract basic information from the job description"""
+        # One pass collects every culture/industry/seniority/salary/benefit keyword
+        hits = {match.group(1).lower() for match in _KEYWORD_RE.finditer(job_description)}
+        # Title, company and location appear near the top; don't regex a whole scraped page for them
+        head = job_description[:_HEAD_CHARS]
+        return {
+            "role_title": self._extract_role_title(head),
+            "company": self._extract_company(head),
+            "key_requirements": self._extract_requirements(job_description),
+            "company_culture": self._extract_culture_hints(hits),
+            "industry": self._extract_industry(hits),
+            "seniority_level": self._extract_seniority(job_description, hits),
+            "location": self._extract_location(head),
+            "salary_hints": self._extract_salary_hints(hits),
+            "benefits": self._extract_benefits(hits)
+        }
+    
     def _extract_role_title(self, text: str) -> str:
         """Extract the job title from the description"""
         # Look for common patterns
-        patterns = [
-            r'(?:Position|Role|Job|We are looking for|Seeking|Hiring)\s*:?\s*([A-Za-z\s&]+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator))',
-            r'([A-Za-z\s&]+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator))\s*position',
-            r'([A-Za-z\s&]+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator))'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ROLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -63,14 +218,8 @@ class JobDescriptionAnalyzer(BaseTool):
     def _extract_company(self, text: str) -> str:
         """Extract company name from the description"""
         # Look for company indicators
-        patterns = [
-            r'(?:at|with|join)\s+([A-Z][a-zA-Z\s&]+(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions))',
-            r'([A-Z][a-zA-Z\s&]+(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions))',
-            r'(?:Company|Organization):\s*([A-Z][a-zA-Z\s&]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -78,28 +227,13 @@ class JobDescriptionAnalyzer(BaseTool):
     
     def _extract_requirements(self, text: str) -> List[str]:
         """Extract key requirements and skills"""
-        requirements = []
-        
-        # Look for technical skills
-        tech_skills = [
-            "Python", "JavaScript", "Java", "C++", "C#", "React", "Angular", "Vue",
-            "Node.js", "Django", "Flask", "AWS", "Azure", "GCP", "Docker", "Kubernetes",
-            "SQL", "MongoDB", "PostgreSQL", "Git", "Linux", "Agile", "Scrum"
-        ]
-        
-        for skill in tech_skills:
-            if skill.lower() in text.lower():
-                requirements.append(skill)
+        # Look for technical skills in one pass, reported in _TECH_SKILLS order
+        found = {match.lower() for match in _TECH_SKILLS_RE.findall(text)}
+        requirements = [skill for skill in _TECH_SKILLS if skill.lower() in found]
         
         # Look for experience requirements
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s*experience',
-            r'experience\s*level:\s*([A-Za-z\s]+)',
-            r'(\d+)\+?\s*years?\s*in\s*([A-Za-z\s]+)'
-        ]
-        
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EXP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 requirements.append(f"{match.group(1)} years experience")
                 break
@@ -110,105 +244,63 @@ class JobDescriptionAnalyzer(BaseTool):
         
         return requirements[:5]  # Limit to top 5
     
-    def _extract_culture_hints(self, text: str) -> str:
-        """Extract hints about company culture"""
-        culture_keywords = {
-            "fast-paced": "Fast-paced startup environment",
-            "startup": "Fast-paced startup environment",
-            "innovative": "Innovative and creative culture",
-            "collaborative": "Collaborative team environment",
-            "remote": "Remote-first culture",
-            "flexible": "Flexible work environment",
-            "growth": "Growth-oriented company",
-            "learning": "Learning-focused organization"
-        }
-        
-        text_lower = text.lower()
-        for keyword, description in culture_keywords.items():
-            if keyword in text_lower:
+    def _extract_culture_hints(self, hits: set) -> str:
+        """Extract hints about company culture from the keyword hits"""
+        for keyword, description in _CULTURE_KEYWORDS.items():
+            if keyword in hits:
                 return description
         
         return "Professional and collaborative environment"  # Default
     
-    def _extract_industry(self, text: str) -> str:
-        """Extract industry information"""
-        industries = {
-            "software": "Technology",
-            "tech": "Technology",
-            "ai": "Artificial Intelligence",
-            "machine learning": "Machine Learning",
-            "data": "Data Science",
-            "finance": "Financial Services",
-            "healthcare": "Healthcare",
-            "ecommerce": "E-commerce",
-            "education": "Education"
-        }
-        
-        text_lower = text.lower()
-        for keyword, industry in industries.items():
-            if keyword in text_lower:
+    def _extract_industry(self, hits: set) -> str:
+        """Extract industry information from the keyword hits"""
+        for keyword, industry in _INDUSTRIES.items():
+            if keyword in hits:
                 return industry
         
         return "Technology"  # Default
     
-    def _extract_seniority(self, text: str) -> str:
-        """Extract seniority level"""
-        text_lower = text.lower()
+    def _extract_seniority(self, text: str, hits: set) -> str:
+        """Extract seniority level from the keyword hits"""
+        levels = {_SENIORITY_LEVELS[word] for word in hits if word in _SENIORITY_LEVELS}
         
-        if any(word in text_lower for word in ["senior", "lead", "principal", "architect"]):
+        # Rare: only rescan when a seniority word may be about someone else
+        if levels:
+            mentoring = _MENTORING_RE.search(text)
+            if mentoring or _REPORTING_RE.search(text):
+                own_text = _REPORTING_RE.sub(" ", _MENTORING_RE.sub(" ", text))
+                levels = {_SENIORITY_LEVELS[word.lower()] for word in _SENIORITY_RE.findall(own_text)}
+                if mentoring:
+                    levels.add("Senior")
+        
+        if "Senior" in levels:
             return "Senior"
-        elif any(word in text_lower for word in ["junior", "entry", "graduate", "intern"]):
+        elif "Junior" in levels:
             return "Junior"
-        elif any(word in text_lower for word in ["mid", "intermediate", "3+", "5+"]):
-            return "Mid-level"
         else:
-            return "Mid-level"  # Default
+            return "Mid-level"  # Default, also covers "mid", "intermediate", "3+", "5+"
     
     def _extract_location(self, text: str) -> str:
         """Extract location information"""
         # Look for location patterns
-        patterns = [
-            r'(?:in|at|based in)\s+([A-Z][a-zA-Z\s,]+(?:CA|NY|TX|FL|WA|Remote|Hybrid))',
-            r'Location:\s*([A-Z][a-zA-Z\s,]+)',
-            r'([A-Z][a-zA-Z\s,]+(?:CA|NY|TX|FL|WA|Remote|Hybrid))'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
         return "Remote/Hybrid"  # Default
     
-    def _extract_salary_hints(self, text: str) -> str:
-        """Extract salary information hints"""
-        if any(word in text.lower() for word in ["competitive", "market rate", "attractive"]):
-            return "Competitive salary"
-        elif any(word in text.lower() for word in ["equity", "stock options", "ownership"]):
-            return "Equity compensation included"
-        else:
-            return "Competitive compensation package"
-    
-    def _extract_benefits(self, text: str) -> List[str]:
-        """Extract benefits information"""
-        benefits = []
-        text_lower = text.lower()
-        
-        benefit_keywords = {
-            "health insurance": "Health insurance",
-            "dental": "Dental coverage",
-            "vision": "Vision coverage",
-            "401k": "401(k) retirement plan",
-            "flexible": "Flexible work arrangements",
-            "remote": "Remote work options",
-            "unlimited pto": "Unlimited PTO",
-            "professional development": "Professional development",
-            "learning": "Learning opportunities"
-        }
+    def _extract_salary_hints(self, hits: set) -> str:
+        """Extract salary information hints from the keyword hits"""
+        for hint, words in _SALARY_HINTS:
+            if not hits.isdisjoint(words):
+                return hint
         
-        for keyword, benefit in benefit_keywords.items():
-            if keyword in text_lower:
-                benefits.append(benefit)
+        return "Competitive compensation package"  # Default
+    
+    def _extract_benefits(self, hits: set) -> List[str]:
+        """Extract benefits information from the keyword hits"""
+        benefits = [benefit for keyword, benefit in _BENEFIT_KEYWORDS.items() if keyword in hits]
         
         if not benefits:
             benefits = ["Health insurance", "Professional development"]
@@ -228,3 +320,17 @@ class JobDescriptionAnalyzer(BaseTool):
             "salary_hints": "Competitive compensation package",
             "benefits": ["Health insurance", "Professional development"]
         }
+
+
+# Shared instance: the tool holds no per-call state, so callers and agents can reuse it
+JOB_ANALYZER = JobDescriptionAnalyzer()
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_cached(job_description: str) -> tuple:
+    """Analyze a job description once; returns frozen (key, value) pairs"""
+    analysis = JOB_ANALYZER._analyze(job_description)
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in analysis.items()
+    )
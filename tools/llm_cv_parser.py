@@ -6,11 +6,133 @@ Uses Ollama LLM to intelligently extract structured information from CV/Resume f
 
 import os
 import re
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-import PyPDF2
+import diskcache
+import requests
 from langchain_ollama import OllamaLLM
 
+logger = logging.getLogger(__name__)
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+EMBEDDING_MODEL = "nomic-embed-text"
+EMBED_BATCH_SIZE = 32  # Chunks per /api/embed request (raise to 128 on CUDA)
+# How long Ollama keeps the parsing and embedding models resident (same setting as config.ollama_config)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# Model used for CV extraction
+CV_PARSER_MODEL = "gemma3:1b"
+# Part of the parsed-CV cache key; bump when the prompts or parsing logic change
+CV_PARSER_VERSION = "2"
+
+# Parsed CVs are cached here, keyed by the CV file contents, parser version, model and prompt
+CV_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", ".cache")) / "jd_agent"
+# Set CV_CACHE=0 to always re-parse the CV with the LLM, bypassing both caches
+CV_CACHE = os.getenv("CV_CACHE", "1") == "1"
+
+# Exact-match LLM response cache, keyed by prompt and model settings; the same
+# diskcache directory config.ollama_llm uses, so it also works when run standalone
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+
+# Concurrent requests the Ollama server handles (same setting as config.ollama_config);
+# start the server with the same OLLAMA_NUM_PARALLEL for section calls to overlap
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "3"))
+
+# Set CV_DEBUG=1 to keep the first 1000 chars of CV text in the parsed data
+CV_DEBUG = os.getenv("CV_DEBUG", "0") == "1"
+
+# Top-level keys of the parsed CV and the JSON type each must have
+_CV_SECTION_TYPES = {
+    'personal_info': dict,
+    'experience': list,
+    'skills': list,
+    'education': list,
+    'projects': list
+}
+
+# Patterns are compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_CONCAT_WORDS_RE = re.compile(r'([a-z])([A-Z])')
+_CONCAT_NUMBER_RE = re.compile(r'([0-9])([A-Za-z])')
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}\b')
+_PHONE_RE = re.compile(r'(?<!\d)(\+?\d[\d\s\-()]{8,18}\d)(?!\d)')
+_LINKEDIN_RE = re.compile(r'(?:linkedin\.com/in/|LinkedIn:?\s*)([A-Za-z0-9\-_]+)', re.IGNORECASE)
+
+# Common technical skills looked for when the LLM skill extraction fails
+_FALLBACK_SKILLS = [
+    'Python', 'JavaScript', 'Java', 'C++', 'React', 'Angular', 'Vue',
+    'Node.js', 'Django', 'Flask', 'AWS', 'Docker', 'Kubernetes',
+    'SQL', 'MongoDB', 'Git', 'Linux', 'Agile', 'Scrum', 'Machine Learning',
+    'NLP', 'Web Scraping', 'Flutter', 'Redis', 'MySQL', 'Celery'
+]
+# One alternation finds every skill in a single pass over the CV. Escaped, with
+# lookarounds instead of \b so 'C++' and 'Node.js' match literally; longest first
+# so 'JavaScript' is tried before 'Java'
+_FALLBACK_SKILLS_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(
+        re.escape(skill) for skill in sorted(_FALLBACK_SKILLS, key=len, reverse=True)
+    ) + r')(?!\w)',
+    re.IGNORECASE
+)
+
+# Every CV prompt starts with the same CV block so Ollama can reuse its KV cache
+# for that prefix across the extraction calls; only the task text differs
+CV_PROMPT_CHARS = 4000
+
+# Context window for the CV prompts. Ollama's default of 2048 tokens would silently
+# truncate a full CV prompt plus its JSON answer; both LLMs use the same value so
+# the model isn't reloaded between them
+CV_NUM_CTX = 8192
+# CV characters per multi-CV prompt (~4 chars per token), leaving about half of
+# CV_NUM_CTX for the JSON answer
+CV_BATCH_CHARS = 3 * CV_PROMPT_CHARS
+
+def _cv_prompt(cv_text: str, task: str) -> str:
+    """Build an extraction prompt with the shared CV block first and the task last"""
+    return f"CV Text:\n{cv_text[:CV_PROMPT_CHARS]}\n\n---\nTask:\n{task}"
+
+# Keys of the combined extraction, shared by the single- and multi-CV prompts
+_CV_SECTIONS_SPEC = """
+        - personal_info: object with name, email, phone, location (City/Country), linkedin (profile URL) and age, if mentioned
+        - experience: array of objects with title, company, period (start - end dates) and description (responsibilities and achievements)
+        - skills: array of skill strings (programming languages, frameworks and libraries, tools and technologies, soft skills and methodologies)
+        - education: array of objects with degree (Bachelor, Master, PhD, etc.), institution, period (start - end years) and gpa if mentioned
+        - projects: array of objects with name, description, period, role and technologies
+"""
+
+def _valid_sections(data: Any) -> Dict[str, Any]:
+    """Keep only the CV sections that came back with the expected JSON type"""
+    if not isinstance(data, dict):
+        return {}
+    return {
+        section: data[section]
+        for section, expected_type in _CV_SECTION_TYPES.items()
+        if isinstance(data.get(section), expected_type)
+    }
+
+# Opened on first use rather than at import
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def _get_response_cache() -> diskcache.Cache:
+    """Return the on-disk LLM response cache, opening it on first use"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = diskcache.Cache(LLM_CACHE_DIR)
+        return _response_cache
+
+# Keep-alive session so embedding batches reuse one connection to Ollama
+_session = requests.Session()
+
 class LLMCVParser:
     """Parse CV/Resume files using LLM for intelligent information extraction"""
     
@@ -22,10 +144,35 @@ class LLMCVParser:
         
         # Initialize Ollama LLM for parsing
         self.llm = OllamaLLM(
-            model="gemma3:1b",  # Remove ollama/ prefix
-            base_url="http://localhost:11434"
+            model=CV_PARSER_MODEL,  # Remove ollama/ prefix
+            base_url=OLLAMA_BASE_URL,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            num_ctx=CV_NUM_CTX
+        )
+        # Same model with Ollama's grammar-constrained JSON output, for the prompts
+        # that expect a JSON object; the response parses as-is, without preamble
+        self.json_llm = OllamaLLM(
+            model=CV_PARSER_MODEL,
+            base_url=OLLAMA_BASE_URL,
+            format="json",
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            num_ctx=CV_NUM_CTX
         )
     
+    def _invoke(self, llm: OllamaLLM, prompt: str) -> str:
+        """Invoke the LLM, reusing the stored response to an identical earlier request"""
+        if not CV_CACHE:
+            return llm.invoke(prompt)
+        
+        request = json.dumps({"model": llm.model, "format": llm.format, "num_ctx": llm.num_ctx, "prompt": prompt})
+        key = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        cache = _get_response_cache()
+        response = cache.get(key)
+        if response is None:
+            response = llm.invoke(prompt)
+            cache.set(key, response, expire=LLM_CACHE_TTL)
+        return response
+    
     def find_cv_file(self) -> Optional[str]:
         """Find the first CV file in the CV folder"""
         if not self.cv_folder.exists():
@@ -45,13 +192,23 @@ class LLMCVParser:
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text content from PDF file"""
+        # Only needed on a cache miss, so keep them off the import path.
+        # PyMuPDF parses in C and is much faster; PyPDF2 remains as a fallback
+        try:
+            import fitz
+        except ImportError:
+            fitz = None
+        
         try:
+            if fitz is not None:
+                with fitz.open(pdf_path) as doc:
+                    return "\n".join(page.get_text("text") for page in doc)
+            
+            import PyPDF2
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                # Join once instead of growing the string page by page
+                return "".join((page.extract_text() or "") + "\n" for page in pdf_reader.pages)
         except Exception as e:
             print(f"❌ Error reading PDF: {e}")
             return ""
@@ -59,19 +216,91 @@ class LLMCVParser:
     def clean_cv_text(self, text: str) -> str:
         """Clean and format the extracted CV text"""
         # Remove excessive whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n', text)
+        text = _WHITESPACE_RE.sub(' ', text)
+        text = _BLANK_LINES_RE.sub('\n', text)
         
         # Clean up common PDF extraction artifacts
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Fix concatenated words
-        text = re.sub(r'([0-9])([A-Za-z])', r'\1 \2', text)  # Fix concatenated numbers and letters
+        text = _CONCAT_WORDS_RE.sub(r'\1 \2', text)  # Fix concatenated words
+        text = _CONCAT_NUMBER_RE.sub(r'\1 \2', text)  # Fix concatenated numbers and letters
         
         return text.strip()
     
+    def embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+        """Embed text chunks with Ollama's batched /api/embed endpoint (one request per batch)"""
+        embeddings = []
+        for start in range(0, len(chunks), EMBED_BATCH_SIZE):
+            response = _session.post(
+                f"{OLLAMA_BASE_URL}/api/embed",
+                json={
+                    "model": EMBEDDING_MODEL,
+                    "input": chunks[start:start + EMBED_BATCH_SIZE],
+                    "keep_alive": OLLAMA_KEEP_ALIVE
+                },
+                timeout=60
+            )
+            response.raise_for_status()
+            embeddings.extend(response.json()["embeddings"])
+        return embeddings
+    
+    def extract_all_with_llm(self, cv_text: str) -> Dict[str, Any]:
+        """Use a single LLM call to extract every CV section
+        
+        Returns only the sections that came back with the expected JSON type,
+        so callers can fall back to the per-section prompts for the rest.
+        """
+        prompt = _cv_prompt(cv_text, """
+        Extract information from the CV text above. Return ONLY a JSON object with these keys:""" + _CV_SECTIONS_SPEC + """
+        Return only the JSON object, no other text:
+        """)
+        
+        try:
+            data = json.loads(self._invoke(self.json_llm, prompt))
+        except Exception as e:
+            logger.warning("⚠️  Combined LLM extraction failed: %s", e)
+            return {}
+        
+        return _valid_sections(data)
+    
+    def extract_all_batch_with_llm(self, cv_texts: List[str]) -> List[Dict[str, Any]]:
+        """Use a single LLM call to extract every section of several CVs
+        
+        Returns one dict per CV, in input order, holding only the sections that
+        came back with the expected JSON type.
+        """
+        cv_blocks = "\n".join(
+            f'<cv id={index}>\n{cv_text[:CV_PROMPT_CHARS]}\n</cv>'
+            for index, cv_text in enumerate(cv_texts)
+        )
+        prompt = f"CV Texts:\n{cv_blocks}\n\n---\nTask:\n" + """
+        Extract information from each CV above. Return ONLY a JSON object with a "cvs" key holding
+        an array with one object per CV, in the same order. Each object has "id" (the CV id) and these keys:""" + _CV_SECTIONS_SPEC + """
+        Return only the JSON object, no other text:
+        """
+        
+        try:
+            data = json.loads(self._invoke(self.json_llm, prompt))
+        except Exception as e:
+            logger.warning("⚠️  Batch LLM extraction failed: %s", e)
+            return [{} for _ in cv_texts]
+        
+        results = [{} for _ in cv_texts]
+        cvs = data.get('cvs') if isinstance(data, dict) else None
+        for position, cv_data in enumerate(cvs if isinstance(cvs, list) else []):
+            if not isinstance(cv_data, dict):
+                continue
+            # The model may echo the id as a string ("1"); fall back to the array position
+            try:
+                index = int(cv_data.get('id', position))
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < len(results):
+                results[index] = _valid_sections(cv_data)
+        return results
+    
     def extract_personal_info_with_llm(self, cv_text: str) -> Dict[str, str]:
         """Use LLM to extract personal information"""
-        prompt = f"""
-        Extract personal information from this CV text. Return ONLY a JSON object with these fields:
+        prompt = _cv_prompt(cv_text, """
+        Extract personal information from the CV text above. Return ONLY a JSON object with these fields:
         - name: Full name of the person
         - email: Email address
         - phone: Phone number
@@ -79,23 +308,16 @@ class LLMCVParser:
         - linkedin: LinkedIn profile URL if mentioned
         - age: Age if mentioned
         
-        CV Text:
-        {cv_text[:2000]}
-        
         Return only the JSON object, no other text:
-        """
+        """)
         
         try:
-            response = self.llm.invoke(prompt)
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                import json
-                return json.loads(json_match.group())
-            else:
-                return self._fallback_personal_info_extraction(cv_text)
+            personal_info = json.loads(self._invoke(self.json_llm, prompt))
+            if isinstance(personal_info, dict):
+                return personal_info
+            return self._fallback_personal_info_extraction(cv_text)
         except Exception as e:
-            print(f"⚠️  LLM extraction failed: {e}")
+            logger.warning("⚠️  LLM extraction failed: %s", e)
             return self._fallback_personal_info_extraction(cv_text)
     
     def _fallback_personal_info_extraction(self, cv_text: str) -> Dict[str, str]:
@@ -110,20 +332,17 @@ class LLMCVParser:
         }
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, cv_text)
+        emails = _EMAIL_RE.findall(cv_text)
         if emails:
             personal_info['email'] = emails[0]
         
         # Extract phone number
-        phone_pattern = r'(\+?[\d\s\-\(\)]{10,})'
-        phones = re.findall(phone_pattern, cv_text)
+        phones = _PHONE_RE.findall(cv_text)
         if phones:
             personal_info['phone'] = phones[0].strip()
         
         # Extract LinkedIn
-        linkedin_pattern = r'(?:linkedin\.com/in/|LinkedIn:?\s*)([A-Za-z0-9\-_]+)'
-        linkedin_matches = re.findall(linkedin_pattern, cv_text, re.IGNORECASE)
+        linkedin_matches = _LINKEDIN_RE.findall(cv_text)
         if linkedin_matches:
             personal_info['linkedin'] = f"linkedin.com/in/{linkedin_matches[0]}"
         
@@ -131,31 +350,27 @@ class LLMCVParser:
     
     def extract_experience_with_llm(self, cv_text: str) -> List[Dict[str, Any]]:
         """Use LLM to extract work experience"""
-        prompt = f"""
-        Extract work experience from this CV text. Return ONLY a JSON array of experience objects.
+        prompt = _cv_prompt(cv_text, """
+        Extract work experience from the CV text above. Return ONLY a JSON array of experience objects.
         Each object should have:
         - title: Job title/role
         - company: Company name
         - period: Employment period (start - end dates)
         - description: Brief description of responsibilities and achievements
         
-        CV Text:
-        {cv_text[:3000]}
-        
         Return only the JSON array, no other text:
-        """
+        """)
         
         try:
-            response = self.llm.invoke(prompt)
+            response = self._invoke(self.llm, prompt)
             # Try to extract JSON array from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response)
             if json_match:
-                import json
                 return json.loads(json_match.group())
             else:
                 return self._fallback_experience_extraction(cv_text)
         except Exception as e:
-            print(f"⚠️  LLM extraction failed: {e}")
+            logger.warning("⚠️  LLM extraction failed: %s", e)
             return self._fallback_experience_extraction(cv_text)
     
     def _fallback_experience_extraction(self, cv_text: str) -> List[Dict[str, Any]]:
@@ -165,79 +380,59 @@ class LLMCVParser:
     
     def extract_skills_with_llm(self, cv_text: str) -> List[str]:
         """Use LLM to extract skills"""
-        prompt = f"""
-        Extract technical skills and competencies from this CV text. 
+        prompt = _cv_prompt(cv_text, """
+        Extract technical skills and competencies from the CV text above.
         Return ONLY a JSON array of skill strings.
-        
+
         Look for:
         - Programming languages
         - Frameworks and libraries
         - Tools and technologies
         - Soft skills and methodologies
         
-        CV Text:
-        {cv_text[:2000]}
-        
         Return only the JSON array, no other text:
-        """
+        """)
         
         try:
-            response = self.llm.invoke(prompt)
+            response = self._invoke(self.llm, prompt)
             # Try to extract JSON array from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response)
             if json_match:
-                import json
                 return json.loads(json_match.group())
             else:
                 return self._fallback_skills_extraction(cv_text)
         except Exception as e:
-            print(f"⚠️  LLM extraction failed: {e}")
+            logger.warning("⚠️  LLM extraction failed: %s", e)
             return self._fallback_skills_extraction(cv_text)
     
     def _fallback_skills_extraction(self, cv_text: str) -> List[str]:
         """Fallback to regex-based extraction if LLM fails"""
-        # Common technical skills to look for
-        common_skills = [
-            'Python', 'JavaScript', 'Java', 'C++', 'React', 'Angular', 'Vue',
-            'Node.js', 'Django', 'Flask', 'AWS', 'Docker', 'Kubernetes',
-            'SQL', 'MongoDB', 'Git', 'Linux', 'Agile', 'Scrum', 'Machine Learning',
-            'NLP', 'Web Scraping', 'Flutter', 'Redis', 'MySQL', 'Celery'
-        ]
-        
-        found_skills = []
-        for skill in common_skills:
-            if re.search(rf'\b{skill}\b', cv_text, re.IGNORECASE):
-                found_skills.append(skill)
-        
-        return found_skills
+        found = {match.lower() for match in _FALLBACK_SKILLS_RE.findall(cv_text)}
+        return [skill for skill in _FALLBACK_SKILLS if skill.lower() in found]
     
     def extract_education_with_llm(self, cv_text: str) -> List[Dict[str, str]]:
         """Use LLM to extract education information"""
-        prompt = f"""
-        Extract education information from this CV text. Return ONLY a JSON array of education objects.
+        prompt = _cv_prompt(cv_text, """
+        Extract education information from the CV text above. Return ONLY a JSON array of education objects.
         Each object should have:
         - degree: Degree type (Bachelor, Master, PhD, etc.)
         - institution: University/College name
         - period: Study period (start - end years)
         - gpa: GPA if mentioned
         
-        CV Text:
-        {cv_text[:2000]}
-        
         Return only the JSON array, no other text:
-        """
+        """)
         
         try:
-            response = self.llm.invoke(prompt)
+            response = self._invoke(self.llm, prompt)
             # Try to extract JSON array from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response)
             if json_match:
-                import json
                 return json.loads(json_match.group())
             else:
                 return self._fallback_education_extraction(cv_text)
         except Exception as e:
-            print(f"⚠️  LLM extraction failed: {e}")
+            logger.warning("⚠️  LLM extraction failed: %s", e)
             return self._fallback_education_extraction(cv_text)
     
     def _fallback_education_extraction(self, cv_text: str) -> List[Dict[str, str]]:
@@ -247,8 +442,8 @@ class LLMCVParser:
     
     def extract_projects_with_llm(self, cv_text: str) -> List[Dict[str, Any]]:
         """Use LLM to extract project information"""
-        prompt = f"""
-        Extract project information from this CV text. Return ONLY a JSON array of project objects.
+        prompt = _cv_prompt(cv_text, """
+        Extract project information from the CV text above. Return ONLY a JSON array of project objects.
         Each object should have:
         - name: Project name
         - description: Brief description
@@ -256,69 +451,162 @@ class LLMCVParser:
         - role: Role in the project
         - technologies: Technologies used
         
-        CV Text:
-        {cv_text[:3000]}
-        
         Return only the JSON array, no other text:
-        """
+        """)
         
         try:
-            response = self.llm.invoke(prompt)
+            response = self._invoke(self.llm, prompt)
             # Try to extract JSON array from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response)
             if json_match:
-                import json
                 return json.loads(json_match.group())
             else:
                 return []
         except Exception as e:
-            print(f"⚠️  LLM extraction failed: {e}")
+            logger.warning("⚠️  LLM extraction failed: %s", e)
             return []
     
-    def parse_cv(self) -> Dict[str, Any]:
+    def _load_cv_text(self, cv_path: str) -> str:
+        """Extract and clean the text of a CV file, or return "" if there is none"""
+        if not cv_path.lower().endswith('.pdf'):
+            logger.warning("⚠️  File format %s not yet supported", Path(cv_path).suffix)
+            return ""
+        
+        cv_text = self.extract_text_from_pdf(cv_path)
+        if not cv_text:
+            logger.warning("❌ No text could be extracted from CV")
+            return ""
+        
+        return self.clean_cv_text(cv_text)
+    
+    def _complete_sections(self, cv_text: str, extracted: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in the sections the combined extraction missed with per-section prompts"""
+        section_extractors = {
+            'personal_info': self.extract_personal_info_with_llm,
+            'experience': self.extract_experience_with_llm,
+            'skills': self.extract_skills_with_llm,
+            'education': self.extract_education_with_llm,
+            'projects': self.extract_projects_with_llm
+        }
+        missing = [section for section in section_extractors if section not in extracted]
+        if missing:
+            # The requests are I/O-bound, so threads let Ollama serve them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(missing), OLLAMA_NUM_PARALLEL)) as executor:
+                futures = {
+                    section: executor.submit(section_extractors[section], cv_text)
+                    for section in missing
+                }
+                extracted = {**extracted, **{section: future.result() for section, future in futures.items()}}
+        parsed_data = {section: extracted[section] for section in section_extractors}
+        # The raw text only helps when debugging the parser; keep it out of agent prompts
+        if CV_DEBUG:
+            parsed_data['raw_text'] = cv_text[:1000]  # First 1000 chars
+        return parsed_data
+    
+    def parse_cv(self, cv_path: Optional[str] = None) -> Dict[str, Any]:
         """Main method to parse CV using LLM"""
         # Find CV file
-        cv_path = self.find_cv_file()
+        cv_path = cv_path or self.find_cv_file()
         if not cv_path:
             return {}
         
         self.cv_file = cv_path
-        
-        # Extract text
-        if cv_path.lower().endswith('.pdf'):
-            self.cv_text = self.extract_text_from_pdf(cv_path)
-        else:
-            print(f"⚠️  File format {Path(cv_path).suffix} not yet supported")
-            return {}
-        
+        self.cv_text = self._load_cv_text(cv_path)
         if not self.cv_text:
-            print("❌ No text could be extracted from CV")
             return {}
         
-        # Clean the text
-        self.cv_text = self.clean_cv_text(self.cv_text)
+        logger.debug("🧠 Using LLM for intelligent CV parsing...")
         
-        print("🧠 Using LLM for intelligent CV parsing...")
+        # Parse all sections with one LLM call; per-section prompts only fill in what it missed
+        extracted = self.extract_all_with_llm(self.cv_text)
+        self.parsed_data = self._complete_sections(self.cv_text, extracted)
         
-        # Parse all sections using LLM
-        self.parsed_data = {
-            'personal_info': self.extract_personal_info_with_llm(self.cv_text),
-            'experience': self.extract_experience_with_llm(self.cv_text),
-            'skills': self.extract_skills_with_llm(self.cv_text),
-            'education': self.extract_education_with_llm(self.cv_text),
-            'projects': self.extract_projects_with_llm(self.cv_text),
-            'raw_text': self.cv_text[:1000]  # First 1000 chars for debugging
-        }
-        
-        print(f"✅ LLM CV parsing completed:")
-        print(f"   - Personal Info: {len(self.parsed_data['personal_info'])} fields")
-        print(f"   - Experience: {len(self.parsed_data['experience'])} entries")
-        print(f"   - Skills: {len(self.parsed_data['skills'])} skills")
-        print(f"   - Education: {len(self.parsed_data['education'])} entries")
-        print(f"   - Projects: {len(self.parsed_data['projects'])} projects")
+        # Logged rather than printed, so callers choose whether parsing is reported
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ LLM CV parsing completed:\n"
+                "   - Personal Info: %d fields\n"
+                "   - Experience: %d entries\n"
+                "   - Skills: %d skills\n"
+                "   - Education: %d entries\n"
+                "   - Projects: %d projects",
+                *(len(self.parsed_data[section]) for section in _CV_SECTION_TYPES)
+            )
         
         return self.parsed_data
     
+    def parse_cvs(self, cv_paths: List[str]) -> List[Dict[str, Any]]:
+        """Parse several CVs, extracting them with as few combined LLM calls as fit
+        
+        CVs are grouped into batches of at most CV_BATCH_CHARS characters of CV text,
+        so no prompt outgrows the context window. Returns one parsed dict per path,
+        in order; {} for files without text.
+        """
+        cv_texts = [self._load_cv_text(cv_path) for cv_path in cv_paths]
+        readable = [index for index, cv_text in enumerate(cv_texts) if cv_text]
+        if not readable:
+            return [{} for _ in cv_paths]
+        
+        batches = [[]]
+        batch_chars = 0
+        for index in readable:
+            size = min(len(cv_texts[index]), CV_PROMPT_CHARS)
+            if batches[-1] and batch_chars + size > CV_BATCH_CHARS:
+                batches.append([])
+                batch_chars = 0
+            batches[-1].append(index)
+            batch_chars += size
+        
+        logger.debug("🧠 Using LLM to parse %d CVs in %d batches...", len(readable), len(batches))
+        
+        results = [{} for _ in cv_paths]
+        for batch in batches:
+            extracted_batch = self.extract_all_batch_with_llm([cv_texts[index] for index in batch])
+            for index, extracted in zip(batch, extracted_batch):
+                results[index] = self._complete_sections(cv_texts[index], extracted)
+        
+        logger.info("✅ LLM CV parsing completed for %d/%d CVs", len(readable), len(cv_paths))
+        return results
+    
+    def parse_cv_cached(self) -> Dict[str, Any]:
+        """Parse the CV, reusing the cached result when the CV file contents are unchanged"""
+        cv_path = self.find_cv_file()
+        if not cv_path:
+            return {}
+        if not CV_CACHE:
+            return self.parse_cv(cv_path)
+        
+        # Besides the file, the key covers everything that shapes the parsed data, so a
+        # parser, model or prompt change re-parses instead of serving a stale entry
+        cv_hasher = hashlib.sha256(Path(cv_path).read_bytes())
+        for part in (CV_PARSER_VERSION, CV_PARSER_MODEL, str(CV_PROMPT_CHARS), str(CV_NUM_CTX),
+                     str(CV_DEBUG), _CV_SECTIONS_SPEC):
+            cv_hasher.update(b"\0" + part.encode("utf-8"))
+        cv_hash = cv_hasher.hexdigest()
+        cache_file = CV_CACHE_DIR / f"cv_{cv_hash}.json"
+        
+        if cache_file.exists():
+            try:
+                self.cv_file = cv_path
+                self.parsed_data = json.loads(cache_file.read_text(encoding="utf-8"))
+                logger.info("✅ Loaded parsed CV from cache: %s", cache_file)
+                return self.parsed_data
+            except (OSError, ValueError) as e:
+                logger.warning("⚠️  Ignoring unreadable CV cache: %s", e)
+        
+        parsed_data = self.parse_cv(cv_path)
+        if parsed_data:
+            try:
+                CV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so a crash never leaves a partial cache
+                tmp_file = cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(parsed_data), encoding="utf-8")
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning("⚠️  Could not write CV cache: %s", e)
+        
+        return parsed_data
+    
     def get_summary(self) -> str:
         """Get a human-readable summary of the CV"""
         if not self.parsed_data:
@@ -350,6 +638,7 @@ class LLMCVParser:
 
 def main():
     """Test the LLM-based CV parser"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = LLMCVParser()
     data = parser.parse_cv()
     
@@ -4,18 +4,152 @@ Personalization Engine for Job Application Email Agent
 Uses CV information to personalize job applications based on job requirements.
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import functools
 import re
+import numpy as np
+
+# Common abbreviation mappings
+_ABBREVIATIONS = {
+    'javascript': ['js'],
+    'python': ['py'],
+    'react': ['reactjs'],
+    'node.js': ['nodejs', 'node'],
+    'aws': ['amazon web services'],
+    'sql': ['mysql', 'postgresql', 'sqlite'],
+    'git': ['github', 'gitlab']
+}
+# Both orderings of every (full name, abbreviation) pair, for O(1) lookups
+_ABBREVIATION_PAIRS = frozenset(
+    pair
+    for full, abbrevs in _ABBREVIATIONS.items()
+    for abbrev in abbrevs
+    for pair in ((full, abbrev), (abbrev, full))
+)
+
+# Requirement keywords and the area to emphasize when any of them appears
+_EMPHASIS_AREAS = (
+    (('communication',), "Communication and collaboration skills"),
+    (('leadership', 'management'), "Leadership and project management experience"),
+    (('agile', 'scrum'), "Agile methodology experience")
+)
+
+@functools.lru_cache(maxsize=256)
+def _title_words(title: str) -> frozenset:
+    """Lowercased words of a job or experience title"""
+    return frozenset(title.lower().split())
+
+@functools.lru_cache(maxsize=256)
+def _title_similarity(job_title: str, exp_title: str) -> float:
+    """Jaccard similarity of the words in two titles"""
+    job_words = _title_words(job_title)
+    exp_words = _title_words(exp_title)
+    
+    if not job_words or not exp_words:
+        return 0.0
+    
+    return len(job_words & exp_words) / len(job_words | exp_words)
+
+@functools.lru_cache(maxsize=128)
+def _skill_scanner(skills: Tuple[str, ...]) -> re.Pattern:
+    """Compile one pattern reporting the longest skill starting at each position
+    
+    The lookahead makes each match zero-width, so overlapping occurrences are all
+    found; a skill hidden inside a longer hit at the same position is a substring
+    of that hit.
+    """
+    alternatives = sorted(skills, key=len, reverse=True)
+    return re.compile(rf'(?=({"|".join(map(re.escape, alternatives))}))')
+
+def _count_skills(skills_lower: List[str], text_lower: str) -> int:
+    """Count how many of the lowercased skills appear in the lowercased text"""
+    needles = tuple(sorted({skill for skill in skills_lower if skill}))
+    if not needles:
+        return len(skills_lower)
+    
+    # One scan of the text instead of one substring search per skill
+    hits = set(_skill_scanner(needles).findall(text_lower))
+    found = {skill for skill in needles if any(skill in hit for hit in hits)}
+    
+    return sum(1 for skill in skills_lower if not skill or skill in found)
 
 class PersonalizationEngine:
     """Engine for personalizing job applications based on CV and job requirements"""
     
-    def __init__(self, cv_data: Dict[str, Any]):
+    def __init__(self, cv_data: Dict[str, Any],
+                 embed_fn: Optional[Callable[[List[str]], List[List[float]]]] = None):
         self.cv_data = cv_data
         self.personal_info = cv_data.get('personal_info', {})
         self.experience = cv_data.get('experience', [])
         self.skills = cv_data.get('skills', [])
         self.education = cv_data.get('education', [])
+        # Lowered experience descriptions, so job matching doesn't redo it per job. LLM-parsed
+        # CVs can contain non-dict entries; those get no description rather than failing here
+        self._exp_desc_lower = [
+            str(exp.get('description') or '').lower() if isinstance(exp, dict) else ''
+            for exp in self.experience
+        ]
+        
+        # CV chunks for embedding similarity; embedded once, on first use
+        self.embed_fn = embed_fn
+        self.cv_chunks = self._build_cv_chunks()
+        self._cv_emb = None
+    
+    def _build_cv_chunks(self) -> List[str]:
+        """Split the structured CV data into short text chunks for embedding"""
+        chunks = []
+        for exp in self.experience:
+            if not isinstance(exp, dict):
+                continue
+            text = " ".join(str(exp.get(key, '')) for key in ('title', 'company', 'description')).strip()
+            if text:
+                chunks.append(text)
+        for project in self.cv_data.get('projects', []):
+            if not isinstance(project, dict):
+                continue
+            text = " ".join(str(project.get(key, '')) for key in ('name', 'description', 'technologies')).strip()
+            if text:
+                chunks.append(text)
+        if self.skills:
+            chunks.append("Skills: " + ", ".join(self.skills))
+        return chunks
+    
+    def _get_cv_embeddings(self) -> np.ndarray:
+        """Return the row-normalized (M, d) matrix of CV chunk embeddings"""
+        if self._cv_emb is None:
+            cv_emb = np.asarray(self.embed_fn(self.cv_chunks), dtype=np.float32)
+            norms = np.linalg.norm(cv_emb, axis=1, keepdims=True)
+            self._cv_emb = cv_emb / np.where(norms == 0, 1, norms)
+        return self._cv_emb
+    
+    def match_jds(self, jd_texts: List[str]) -> np.ndarray:
+        """
+        Score job descriptions against the CV chunks by cosine similarity.
+        
+        All JDs are embedded in one batch and scored with a single (N, d) @ (d, M)
+        matrix product. Returns an (N, M) array, or an (N, 0) array when no
+        embedding function or CV chunks are available.
+        """
+        if not self.embed_fn or not self.cv_chunks or not jd_texts:
+            return np.zeros((len(jd_texts), 0), dtype=np.float32)
+        
+        cv_emb = self._get_cv_embeddings()
+        jd_emb = np.asarray(self.embed_fn(jd_texts), dtype=np.float32)
+        norms = np.linalg.norm(jd_emb, axis=1, keepdims=True)
+        jd_emb /= np.where(norms == 0, 1, norms)
+        return jd_emb @ cv_emb.T
+    
+    def match_jd(self, jd_text: str) -> np.ndarray:
+        """Score a single job description against the CV chunks"""
+        return self.match_jds([jd_text])[0]
+    
+    def get_cv_highlights(self, jd_texts: List[str], top_k: int = 3) -> List[List[str]]:
+        """Return the top_k CV chunks most similar to each job description"""
+        scores = self.match_jds(jd_texts)
+        if scores.shape[1] == 0:
+            return [[] for _ in jd_texts]
+        top_indices = np.argsort(-scores, axis=1)[:, :top_k]
+        return [[self.cv_chunks[i] for i in row] for row in top_indices]
     
     def analyze_skills_match(self, job_requirements: List[str]) -> Dict[str, Any]:
         """Analyze how well CV skills match job requirements"""
@@ -24,22 +158,24 @@ class PersonalizationEngine:
         
         # Normalize skills for comparison
         normalized_job_skills = [skill.lower().strip() for skill in job_requirements]
-        normalized_cv_skills = [skill.lower().strip() for skill in self.skills]
+        cv_skill_set = {skill.lower().strip() for skill in self.skills}
         
         matched_skills = []
         missing_skills = []
         
         for job_skill in normalized_job_skills:
-            # Check for exact matches and partial matches
-            matched = False
-            for cv_skill in normalized_cv_skills:
-                if (job_skill in cv_skill or cv_skill in job_skill or 
-                    self._calculate_similarity(job_skill, cv_skill) > 0.7):
-                    matched_skills.append(job_skill)
-                    matched = True
-                    break
+            # Exact matches are a set lookup, then partial matches; only skills left
+            # unmatched by both need the abbreviation check, the one case where
+            # _calculate_similarity can pass 0.7 without containment
+            matched = (
+                job_skill in cv_skill_set or
+                any(job_skill in cv_skill or cv_skill in job_skill for cv_skill in cv_skill_set) or
+                any(self._are_abbreviations(job_skill, cv_skill) for cv_skill in cv_skill_set)
+            )
             
-            if not matched:
+            if matched:
+                matched_skills.append(job_skill)
+            else:
                 missing_skills.append(job_skill)
         
         # Calculate match score
@@ -71,36 +207,20 @@ class PersonalizationEngine:
     
     def _are_abbreviations(self, skill1: str, skill2: str) -> bool:
         """Check if skills are abbreviations of each other"""
-        # Common abbreviation mappings
-        abbreviations = {
-            'javascript': ['js'],
-            'python': ['py'],
-            'react': ['reactjs'],
-            'node.js': ['nodejs', 'node'],
-            'aws': ['amazon web services'],
-            'sql': ['mysql', 'postgresql', 'sqlite'],
-            'git': ['github', 'gitlab']
-        }
-        
-        skill1_lower = skill1.lower()
-        skill2_lower = skill2.lower()
-        
-        for full, abbrevs in abbreviations.items():
-            if skill1_lower == full and skill2_lower in abbrevs:
-                return True
-            if skill2_lower == full and skill1_lower in abbrevs:
-                return True
-        
-        return False
+        return (skill1.lower(), skill2.lower()) in _ABBREVIATION_PAIRS
     
     def find_relevant_experience(self, job_title: str, required_skills: List[str]) -> List[Dict[str, Any]]:
         """Find experience entries most relevant to the job"""
         if not self.experience:
             return []
         
-        relevant_experience = []
+        # Score first and copy only the entries that make the top 3
+        scored = []
+        skills_lower = [skill.lower() for skill in required_skills]
         
-        for exp in self.experience:
+        for index, exp in enumerate(self.experience):
+            if not isinstance(exp, dict):
+                continue
             relevance_score = 0
             
             # Check title relevance
@@ -109,45 +229,30 @@ class PersonalizationEngine:
                 relevance_score += title_similarity * 0.4
             
             # Check skills relevance
-            if required_skills and exp.get('description'):
-                skills_in_description = self._count_skills_in_text(required_skills, exp['description'])
+            if required_skills and self._exp_desc_lower[index]:
+                skills_in_description = _count_skills(skills_lower, self._exp_desc_lower[index])
                 relevance_score += (skills_in_description / len(required_skills)) * 0.6
             
             if relevance_score > 0.1:  # Only include if somewhat relevant
-                exp_copy = exp.copy()
-                exp_copy['relevance_score'] = relevance_score
-                relevant_experience.append(exp_copy)
+                scored.append((relevance_score, index))
         
         # Sort by relevance score
-        relevant_experience.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        return relevant_experience[:3]  # Return top 3 most relevant
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [  # Return top 3 most relevant
+            {**self.experience[index], 'relevance_score': relevance_score}
+            for relevance_score, index in scored[:3]
+        ]
     
     def _calculate_title_similarity(self, job_title: str, exp_title: str) -> float:
         """Calculate similarity between job title and experience title"""
-        job_words = set(job_title.lower().split())
-        exp_words = set(exp_title.lower().split())
-        
-        if not job_words or not exp_words:
-            return 0.0
-        
-        intersection = job_words.intersection(exp_words)
-        union = job_words.union(exp_words)
-        
-        return len(intersection) / len(union) if union else 0.0
+        return _title_similarity(job_title, exp_title)
     
     def _count_skills_in_text(self, skills: List[str], text: str) -> int:
         """Count how many skills appear in the given text"""
         if not text:
             return 0
         
-        text_lower = text.lower()
-        count = 0
-        
-        for skill in skills:
-            if skill.lower() in text_lower:
-                count += 1
-        
-        return count
+        return _count_skills([skill.lower() for skill in skills], text.lower())
     
     def generate_personalized_content(self, job_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate personalized content for job application"""
@@ -175,6 +280,10 @@ class PersonalizationEngine:
             'areas_to_emphasize': self._identify_emphasis_areas(job_analysis)
         }
     
+    def generate_batch(self, job_analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate personalized content for several job analyses against this CV"""
+        return [self.generate_personalized_content(job_analysis) for job_analysis in job_analyses]
+    
     def _generate_talking_points(self, skills_analysis: Dict, 
                                 relevant_experience: List[Dict], 
                                 job_analysis: Dict) -> List[str]:
@@ -230,19 +339,12 @@ class PersonalizationEngine:
     
     def _identify_emphasis_areas(self, job_analysis: Dict) -> List[str]:
         """Identify areas to emphasize based on job requirements"""
-        emphasis_areas = []
-        
-        required_skills = job_analysis.get('key_requirements', [])
-        if 'communication' in ' '.join(required_skills).lower():
-            emphasis_areas.append("Communication and collaboration skills")
-        
-        if any(skill in ' '.join(required_skills).lower() for skill in ['leadership', 'management']):
-            emphasis_areas.append("Leadership and project management experience")
-        
-        if any(skill in ' '.join(required_skills).lower() for skill in ['agile', 'scrum']):
-            emphasis_areas.append("Agile methodology experience")
-        
-        return emphasis_areas
+        # Join the requirements once rather than once per keyword
+        requirements = ' '.join(job_analysis.get('key_requirements', [])).lower()
+        return [
+            area for keywords, area in _EMPHASIS_AREAS
+            if any(keyword in requirements for keyword in keywords)
+        ]
     
     def get_candidate_summary(self) -> str:
         """Get a summary of the candidate for the application"""